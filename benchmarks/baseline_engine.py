@@ -0,0 +1,300 @@
+# Motor de combinações original (app.py do commit inicial, antes da extração do pacote
+# load_combinations), copiado sem alterações. Serve de referência para check_baseline.py:
+# a saída de load_combinations.generate_combinations deve ser idêntica à deste módulo.
+
+# Dicionário com as categorias de ação conforme Tabela 1 da ABNT NBR 8800:2008
+ACTION_CATEGORIES = {
+    # Ações Permanentes
+    "G_Me": {"type": "permanente", "gamma": {"Normal": 1.25, "Especial": 1.15, "Excepcional": 1.10}, "is_wind": False},  # Peso próprio de estruturas metálicas
+    "G_Pr": {"type": "permanente", "gamma": {"Normal": 1.30, "Especial": 1.20, "Excepcional": 1.15}, "is_wind": False},  # Peso próprio de estruturas pré-fabricadas
+    "G_Si": {"type": "permanente", "gamma": {"Normal": 1.35, "Especial": 1.25, "Excepcional": 1.15}, "is_wind": False},  # Peso próprio de estruturas construídas in situ
+    "G_Ec": {"type": "permanente", "gamma": {"Normal": 1.40, "Especial": 1.30, "Excepcional": 1.20}, "is_wind": False},  # Elementos construtivos industrializados com adição in situ
+    "G_Eg": {"type": "permanente", "gamma": {"Normal": 1.50, "Especial": 1.40, "Excepcional": 1.30}, "is_wind": False},  # Elementos construtivos em geral e equipamentos
+    "SET": {"type": "permanente", "gamma": {"Normal": 1.35, "Especial": 1.25, "Excepcional": 1.15}, "is_wind": False},   # Assentamentos de apoios, retrações
+
+    # Ações Variáveis
+    "Q_U": {"type": "variavel", "gamma": {"Normal": 1.50, "Especial": 1.30, "Excepcional": 1.00}, "is_wind": False},    # Ações de valores máximos limitados
+    "Q_T": {"type": "variavel", "gamma": {"Normal": 1.20, "Especial": 1.10, "Excepcional": 1.00}, "is_wind": False},    # Temperatura (sem fogo)
+    "Q_V": {"type": "variavel", "gamma": {"Normal": 1.40, "Especial": 1.20, "Excepcional": 1.00}, "is_wind": True},     # Vento
+    "Q_G": {"type": "variavel", "gamma": {"Normal": 1.50, "Especial": 1.30, "Excepcional": 1.00}, "is_wind": False},    # Ações variáveis genéricas
+
+    # Ações Excepcionais
+    "Q_Exc": {"type": "excepcional", "gamma": {"Normal": 1.00, "Especial": 1.00, "Excepcional": 1.00}, "is_wind": False},  # Excepcional
+
+    # Nenhuma
+    "NONE": {"type": "permanente", "gamma": {"Normal": 1.00, "Especial": 1.00, "Excepcional": 1.00}, "is_wind": False},  # Nenhuma ação
+}
+
+# Dicionário com os fatores de combinação ψ₀, ψ₁, ψ₂ conforme Tabela 2 da ABNT NBR 8800
+ACTION_FACTORS = {
+    "Locais sem predominância de pesos/equipamentos fixos ou elevadas concentrações de pessoas": {"ψ₀": 0.5, "ψ₁": 0.4, "ψ₂": 0.3},
+    "Locais com predominância de pesos/equipamentos fixos ou elevadas concentrações de pessoas": {"ψ₀": 0.7, "ψ₁": 0.6, "ψ₂": 0.4},
+    "Bibliotecas, arquivos, depósitos, oficinas, garagens e coberturas": {"ψ₀": 0.8, "ψ₁": 0.7, "ψ₂": 0.6},
+    "Pressão dinâmica do vento nas estruturas em geral": {"ψ₀": 0.6, "ψ₁": 0.3, "ψ₂": 0.0},
+    "Variações uniformes de temperatura em relação à média anual local": {"ψ₀": 0.6, "ψ₁": 0.5, "ψ₂": 0.3},
+    "Passarelas de pedestres": {"ψ₀": 0.6, "ψ₁": 0.4, "ψ₂": 0.3},
+    "Vigas de rolamento de pontes rolantes": {"ψ₀": 1.0, "ψ₁": 0.8, "ψ₂": 0.5},
+    "Pilares e subestruturas que suportem vigas de rolamento de pontes rolantes": {"ψ₀": 0.7, "ψ₁": 0.6, "ψ₂": 0.4}
+}
+
+# Função para determinar os fatores de ponderação com base na categoria e frequência
+def get_factors(load, frequency, is_main=False):
+    load_type = load["type"]
+    category = load["category"]
+    action_info = ACTION_CATEGORIES[category]
+
+    if action_info["type"] == "permanente":
+        if frequency in ["Normal", "Frequente", "Rara"]:
+            return action_info["gamma"]["Normal"]
+        elif frequency == "Acidental":
+            return action_info["gamma"]["Excepcional"]
+        return 1.0
+    elif action_info["type"] == "variavel":
+        psi_0 = load["factors"]["ψ₀"]
+        psi_1 = load["factors"]["ψ₁"]
+        psi_2 = load["factors"]["ψ₂"]
+        gamma_q = action_info["gamma"]["Normal"]
+        if frequency in ["Frequente", "Rara"]:
+            gamma_q = action_info["gamma"]["Especial"]
+        elif frequency in ["ELS Normal", "ELS Frequente - Danos Reversíveis", "ELS Frequente - Danos Irreversíveis", "ELS Quase Permanente", "ELS Rara"]:
+            gamma_q = 1.0
+        
+        if frequency == "Normal":
+            return gamma_q if is_main else (gamma_q * psi_0)
+        elif frequency == "Frequente":
+            return (gamma_q * psi_1) if is_main else (gamma_q * psi_0)
+        elif frequency == "Rara":
+            # Para vento (Q_V), usar apenas ψ₀, independentemente de ser predominante ou não
+            if action_info["is_wind"]:
+                return psi_0
+            return gamma_q if is_main else (gamma_q * psi_0)
+        elif frequency == "ELS Normal":
+            return 1.0
+        elif frequency == "ELS Frequente - Danos Reversíveis":
+            return psi_1 if is_main else psi_2
+        elif frequency == "ELS Frequente - Danos Irreversíveis":
+            return psi_1 if is_main else psi_2
+        elif frequency == "ELS Quase Permanente":
+            return psi_2
+        elif frequency == "ELS Rara":
+            return 1.0 if is_main else psi_1
+    elif action_info["type"] == "excepcional":
+        if frequency == "Acidental":
+            return 1.0  # Ajustado conforme referência
+        return 1.0  # Ajustado para ELU Rara conforme referência
+    return 1.0
+
+# Função para calcular o carregamento total Q [kN/m²]
+def calculate_q(loads, combination_str):
+    q_total = 0.0
+    parts = combination_str.split()
+    for i in range(0, len(parts), 2):
+        load_idx = int(parts[i]) - 1
+        factor = float(parts[i + 1])
+        load_value = loads[load_idx]["value"]
+        direction = loads[load_idx]["direction"]
+        sign = 1 if direction == "Positiva" else -1
+        q_total += sign * load_value * factor
+    return round(q_total, 3)
+
+# Função para gerar combinações de carga com base nos tipos selecionados
+def generate_combinations(loads, selected_types):
+    combinations_list = []
+    idx = 1
+
+    # Separar cargas por tipo
+    permanent_loads = [(i+1, load["name"]) for i, load in enumerate(loads) if ACTION_CATEGORIES[load["category"]]["type"] == "permanente"]
+    variable_loads = [(i+1, load["name"]) for i, load in enumerate(loads) if ACTION_CATEGORIES[load["category"]]["type"] == "variavel"]
+    exceptional_loads = [(i+1, load["name"]) for i, load in enumerate(loads) if ACTION_CATEGORIES[load["category"]]["type"] == "excepcional"]
+
+    # Separar cargas de vento
+    wind_loads = [(i+1, load["name"]) for i, load in enumerate(loads) if ACTION_CATEGORIES[load["category"]]["is_wind"]]
+    non_wind_variable_loads = [(i+1, load["name"]) for i, load in enumerate(loads) if ACTION_CATEGORIES[load["category"]]["type"] == "variavel" and not ACTION_CATEGORIES[load["category"]]["is_wind"]]
+
+    # Função auxiliar para adicionar combinações
+    def add_combination(perms, vars, freq, type_state, criterion, idx):
+        nonlocal combinations_list
+        combination = []
+        load_indices = []
+
+        # Adicionar cargas permanentes
+        for i, _ in perms:
+            factor = get_factors(loads[i-1], freq)
+            combination.extend([str(i), str(factor)])
+            load_indices.append(i-1)
+
+        # Adicionar cargas variáveis
+        for i, _ in vars:
+            is_main = (i == vars[0][0])
+            factor = get_factors(loads[i-1], freq, is_main=is_main)
+            if factor > 0:
+                combination.extend([str(i), str(factor)])
+                load_indices.append(i-1)
+
+        combination_str = " ".join(combination)
+        if combination_str:
+            q_value = calculate_q(loads, combination_str)
+            freq_display = freq.replace("ELS ", "").split(" - ")[0]
+
+            # Obter categorias e frequências das cargas envolvidas
+            categories = [loads[idx]["category"] for idx in load_indices]
+            frequencies = [loads[idx]["action_type"] if ACTION_CATEGORIES[loads[idx]["category"]]["type"] == "variavel" else "N/A" for idx in load_indices]
+
+            combinations_list.append([
+                idx, combination_str, type_state, freq_display, criterion, q_value,
+                ", ".join(categories), ", ".join(frequencies)
+            ])
+        return idx + 1
+
+    # Combinações apenas com cargas permanentes
+    if permanent_loads:
+        if "ELU Normal" in selected_types:
+            combination = []
+            load_indices = []
+            for i, _ in permanent_loads:
+                factor = get_factors(loads[i-1], "Normal")
+                combination.extend([str(i), str(factor)])
+                load_indices.append(i-1)
+            combination_str = " ".join(combination)
+            if combination_str:
+                q_value = calculate_q(loads, combination_str)
+                categories = [loads[idx]["category"] for idx in load_indices]
+                frequencies = ["N/A" for _ in load_indices]
+                combinations_list.append([
+                    idx, combination_str, "ELU", "Normal", "Resistência", q_value,
+                    ", ".join(categories), ", ".join(frequencies)
+                ])
+                idx += 1
+
+        if "ELS Normal" in selected_types:
+            combination = []
+            load_indices = []
+            for i, _ in permanent_loads:
+                factor = get_factors(loads[i-1], "ELS Normal")
+                combination.extend([str(i), str(factor)])
+                load_indices.append(i-1)
+            combination_str = " ".join(combination)
+            if combination_str:
+                q_value = calculate_q(loads, combination_str)
+                categories = [loads[idx]["category"] for idx in load_indices]
+                frequencies = ["N/A" for _ in load_indices]
+                combinations_list.append([
+                    idx, combination_str, "ELS", "Normal", "Conforto Visual", q_value,
+                    ", ".join(categories), ", ".join(frequencies)
+                ])
+                idx += 1
+
+    # ELU Normal
+    if "ELU Normal" in selected_types:
+        # Primeiro, combinações sem cargas de vento
+        if non_wind_variable_loads:
+            for main_var_idx, _ in non_wind_variable_loads:
+                vars_to_combine = [(main_var_idx, "")] + [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                idx = add_combination(permanent_loads, vars_to_combine, "Normal", "ELU", "Resistência", idx)
+        # Depois, combinações com uma carga de vento por vez
+        for wind_idx, _ in wind_loads:
+            # Se não houver outras cargas variáveis, vento é predominante
+            if not non_wind_variable_loads:
+                vars_to_combine = [(wind_idx, "")]
+                idx = add_combination(permanent_loads, vars_to_combine, "Normal", "ELU", "Resistência", idx)
+            else:
+                for main_var_idx, _ in non_wind_variable_loads + [(wind_idx, "")]:
+                    vars_to_combine = [(main_var_idx, "")]
+                    # Adicionar outras cargas variáveis não-vento
+                    vars_to_combine += [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                    # Se a carga principal não for vento, adicionar a carga de vento atual
+                    if main_var_idx != wind_idx:
+                        vars_to_combine.append((wind_idx, ""))
+                    idx = add_combination(permanent_loads, vars_to_combine, "Normal", "ELU", "Resistência", idx)
+
+    # ELU Frequente
+    if "ELU Frequente" in selected_types:
+        if non_wind_variable_loads:
+            for main_var_idx, _ in non_wind_variable_loads:
+                vars_to_combine = [(main_var_idx, "")] + [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                idx = add_combination(permanent_loads, vars_to_combine, "Frequente", "ELU", "Resistência", idx)
+        for wind_idx, _ in wind_loads:
+            if not non_wind_variable_loads:
+                vars_to_combine = [(wind_idx, "")]
+                idx = add_combination(permanent_loads, vars_to_combine, "Frequente", "ELU", "Resistência", idx)
+            else:
+                for main_var_idx, _ in non_wind_variable_loads + [(wind_idx, "")]:
+                    vars_to_combine = [(main_var_idx, "")]
+                    vars_to_combine += [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                    if main_var_idx != wind_idx:
+                        vars_to_combine.append((wind_idx, ""))
+                    idx = add_combination(permanent_loads, vars_to_combine, "Frequente", "ELU", "Resistência", idx)
+
+    # ELU Rara
+    if "ELU Rara" in selected_types:
+        if non_wind_variable_loads:
+            for main_var_idx, _ in non_wind_variable_loads:
+                vars_to_combine = [(main_var_idx, "")] + [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                idx = add_combination(permanent_loads, vars_to_combine, "Rara", "ELU", "Resistência", idx)
+        for wind_idx, _ in wind_loads:
+            if not non_wind_variable_loads:
+                vars_to_combine = [(wind_idx, "")]
+                idx = add_combination(permanent_loads, vars_to_combine, "Rara", "ELU", "Resistência", idx)
+            else:
+                for main_var_idx, _ in non_wind_variable_loads + [(wind_idx, "")]:
+                    vars_to_combine = [(main_var_idx, "")]
+                    vars_to_combine += [(i, "") for i, _ in non_wind_variable_loads if i != main_var_idx]
+                    if main_var_idx != wind_idx:
+                        vars_to_combine.append((wind_idx, ""))
+                    idx = add_combination(permanent_loads, vars_to_combine, "Rara", "ELU", "Resistência", idx)
+
+    # ELU Acidental
+    if "ELU Acidental" in selected_types:
+        for exc_idx, _ in exceptional_loads:
+            combination = []
+            load_indices = []
+            for i, _ in permanent_loads:
+                combination.extend([str(i), str(get_factors(loads[i-1], "Acidental"))])
+                load_indices.append(i-1)
+            combination.extend([str(exc_idx), str(get_factors(loads[exc_idx-1], "Acidental"))])
+            load_indices.append(exc_idx-1)
+            combination_str = " ".join(combination)
+            if combination_str:
+                q_value = calculate_q(loads, combination_str)
+                categories = [loads[idx]["category"] for idx in load_indices]
+                frequencies = ["N/A" for _ in load_indices]
+                combinations_list.append([
+                    idx, combination_str, "ELU", "Acidental", "Resistência", q_value,
+                    ", ".join(categories), ", ".join(frequencies)
+                ])
+                idx += 1
+
+    # ELS Quase Permanente
+    if "ELS Quase Permanente" in selected_types:
+        if non_wind_variable_loads:
+            for var_idx, _ in non_wind_variable_loads:
+                idx = add_combination(permanent_loads, [(var_idx, "")], "ELS Quase Permanente", "ELS", "Conforto Visual", idx)
+        # Não adicionar vento, pois ψ₂ = 0.0 para Q_V
+
+    # ELS Frequente - Danos Reversíveis
+    if "ELS Frequente - Danos Reversíveis" in selected_types:
+        if non_wind_variable_loads:
+            for var_idx, _ in non_wind_variable_loads:
+                idx = add_combination(permanent_loads, [(var_idx, "")], "ELS Frequente - Danos Reversíveis", "ELS", "Danos Reversíveis", idx)
+        for wind_idx, _ in wind_loads:
+            idx = add_combination(permanent_loads, [(wind_idx, "")], "ELS Frequente - Danos Reversíveis", "ELS", "Danos Reversíveis", idx)
+
+    # ELS Frequente - Danos Irreversíveis
+    if "ELS Frequente - Danos Irreversíveis" in selected_types:
+        if non_wind_variable_loads:
+            for var_idx, _ in non_wind_variable_loads:
+                idx = add_combination(permanent_loads, [(var_idx, "")], "ELS Frequente - Danos Irreversíveis", "ELS", "Danos Irreversíveis", idx)
+        for wind_idx, _ in wind_loads:
+            idx = add_combination(permanent_loads, [(wind_idx, "")], "ELS Frequente - Danos Irreversíveis", "ELS", "Danos Irreversíveis", idx)
+
+    # ELS Rara
+    if "ELS Rara" in selected_types:
+        if non_wind_variable_loads:
+            for var_idx, _ in non_wind_variable_loads:
+                vars_to_combine = [(var_idx, "")] + [(i, "") for i, _ in non_wind_variable_loads + wind_loads if i != var_idx]
+                idx = add_combination(permanent_loads, vars_to_combine, "ELS Rara", "ELS", "Danos Irreversíveis", idx)
+        for wind_idx, _ in wind_loads:
+            vars_to_combine = [(wind_idx, "")] + [(i, "") for i, _ in non_wind_variable_loads if i != wind_idx]
+            idx = add_combination(permanent_loads, vars_to_combine, "ELS Rara", "ELS", "Danos Irreversíveis", idx)
+
+    return combinations_list
@@ -0,0 +1,95 @@
+# Benchmark da exportação para Excel: DataFrame + pd.ExcelWriter (modo normal do openpyxl)
+# contra a gravação incremental (modo write-only) alimentada por engine.iter_rows.
+#
+# Cada medição roda em um subprocesso para isolar o pico de memória (RSS).
+# Uso: python benchmarks/bench_excel.py [--rows 1000 10000 50000]
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+
+from synthetic import ALL_TYPES, ROOT, make_loads
+
+MODES = ["dataframe", "streaming"]
+
+
+# Função para escolher quantas cargas sintéticas geram pelo menos `rows` combinações
+def loads_for_rows(rows):
+    from load_combinations import iter_combinations
+
+    n = max(4, int(math.sqrt(rows / 0.3)))
+    while True:
+        loads = make_loads(n)
+        if sum(1 for _ in iter_combinations(loads, ALL_TYPES)) >= rows:
+            return n
+        n = int(n * 1.2) + 1
+
+
+# Função executada no subprocesso: exporta `rows` linhas e mede tempo e pico de memória
+def run_child(mode, n_loads, rows):
+    import io
+    import itertools
+    import resource
+    import time
+
+    from load_combinations.engine import COLUMNS, iter_rows
+    from load_combinations.export import write_xlsx, xlsx_bytes
+    import pandas as pd
+
+    loads = make_loads(n_loads)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    output = io.BytesIO()
+    row_iter = itertools.islice(iter_rows(loads, ALL_TYPES), rows)
+    if mode == "dataframe":
+        df = pd.DataFrame(list(row_iter), columns=COLUMNS)
+        output.write(xlsx_bytes(df))
+    else:
+        write_xlsx(row_iter, output)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "mode": mode,
+        "rows": rows,
+        "loads": n_loads,
+        "seconds": elapsed,
+        "peak_rss_mb": peak_rss / 1024,
+        "delta_rss_mb": (peak_rss - baseline_rss) / 1024,
+        "xlsx_mb": output.tell() / 1024 / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exportação Excel: modo normal contra incremental")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--json", help="Arquivo para gravar os resultados em JSON")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "LOADS", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, n_loads, rows = args.child
+        run_child(mode, int(n_loads), int(rows))
+        return
+
+    results = []
+    print(f"{'modo':<10} {'linhas':>8} {'cargas':>7} {'tempo [s]':>10} {'pico RSS [MB]':>14} {'Δ RSS [MB]':>11} {'xlsx [MB]':>10}")
+    for rows in args.rows:
+        n_loads = loads_for_rows(rows)
+        for mode in MODES:
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode, str(n_loads), str(rows)],
+                cwd=ROOT, capture_output=True, text=True, check=True
+            )
+            result = json.loads(completed.stdout)
+            results.append(result)
+            print(f"{mode:<10} {rows:>8} {n_loads:>7} {result['seconds']:>10.2f} {result['peak_rss_mb']:>14.1f} {result['delta_rss_mb']:>11.1f} {result['xlsx_mb']:>10.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Micro-benchmark: get_factors (cadeia de comparações de strings) contra a tabela
+# pré-calculada de fatores usada pelo gerador.
+#
+# Uso: python benchmarks/bench_factors.py [--loads N] [--repeat N]
+import argparse
+import timeit
+
+from synthetic import make_loads
+
+from load_combinations import FREQUENCIES, factor_table, get_factors
+from load_combinations.factors import FREQUENCY_INDEX, _build_factor_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_factors contra tabela de fatores")
+    parser.add_argument("--loads", type=int, default=40, help="Número de cargas sintéticas")
+    parser.add_argument("--repeat", type=int, default=200, help="Repetições de cada varredura")
+    args = parser.parse_args()
+
+    loads = make_loads(args.loads)
+    queries = [(i, frequency, is_main) for i in range(len(loads)) for frequency in FREQUENCIES for is_main in (False, True)]
+
+    def with_get_factors():
+        for i, frequency, is_main in queries:
+            get_factors(loads[i], frequency, is_main=is_main)
+
+    lookup = factor_table(loads).tolist()
+    indexed = [(i, FREQUENCY_INDEX[frequency], is_main) for i, frequency, is_main in queries]
+
+    def with_table():
+        for i, j, is_main in indexed:
+            lookup[i][j][is_main]
+
+    def build_table():
+        _build_factor_table.cache_clear()
+        factor_table(loads)
+
+    t_branchy = min(timeit.repeat(with_get_factors, number=args.repeat, repeat=5)) / args.repeat
+    t_table = min(timeit.repeat(with_table, number=args.repeat, repeat=5)) / args.repeat
+    t_build = min(timeit.repeat(build_table, number=20, repeat=5)) / 20
+
+    per_query = 1e9 / len(queries)
+    print(f"{len(queries)} consultas ({args.loads} cargas × {len(FREQUENCIES)} frequências × principal/secundária)")
+    print(f"  get_factors:          {t_branchy * per_query:8.1f} ns/consulta")
+    print(f"  tabela pré-calculada: {t_table * per_query:8.1f} ns/consulta  ({t_branchy / t_table:.1f}x)")
+    print(f"  construção da tabela: {t_build * 1e6:8.1f} µs (uma vez por estrutura de cargas)")
+
+
+if __name__ == "__main__":
+    main()
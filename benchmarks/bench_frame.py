@@ -0,0 +1,63 @@
+# Benchmark da montagem do DataFrame de combinações: a partir de listas de linhas
+# (CombinationSet.to_rows, colunas object) contra a montagem colunar com dtype category
+# (export.combinations_dataframe). Mede tempo (estrutura recém-enumerada, sem rótulos em
+# cache), pico de memória sob tracemalloc e memória final do DataFrame (deep).
+#
+# Uso: python benchmarks/bench_frame.py [--loads 25 50 100 150] [--repeat 3]
+import argparse
+import gc
+import time
+import tracemalloc
+
+from synthetic import ALL_TYPES, make_loads
+
+import pandas as pd
+
+from load_combinations import COLUMNS, build_combination_set
+from load_combinations.engine import _build_structure
+from load_combinations.export import combinations_dataframe
+
+MODES = {
+    "linhas": lambda combination_set: pd.DataFrame(combination_set.to_rows(), columns=COLUMNS),
+    "colunar": combinations_dataframe,
+}
+
+
+# Função para medir um modo: tempo mínimo, pico de memória e tamanho do DataFrame
+def measure(mode, loads, repeat):
+    build = MODES[mode]
+    times = []
+    for _ in range(repeat):
+        _build_structure.cache_clear()
+        combination_set = build_combination_set(loads, ALL_TYPES)
+        gc.collect()
+        start = time.perf_counter()
+        build(combination_set)
+        times.append(time.perf_counter() - start)
+
+    _build_structure.cache_clear()
+    combination_set = build_combination_set(loads, ALL_TYPES)
+    gc.collect()
+    tracemalloc.start()
+    df = build(combination_set)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(df), min(times), peak, int(df.memory_usage(deep=True).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataFrame por linhas contra colunar/categórico")
+    parser.add_argument("--loads", type=int, nargs="+", default=[25, 50, 100, 150])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'cargas':>6} {'linhas':>7} {'modo':<8} {'tempo ms':>9} {'pico MiB':>9} {'DataFrame MiB':>14}")
+    for n in args.loads:
+        loads = make_loads(n)
+        for mode in MODES:
+            rows, seconds, peak, size = measure(mode, loads, args.repeat)
+            print(f"{n:>6} {rows:>7} {mode:<8} {seconds * 1000:>9.1f} {peak / 2**20:>9.2f} {size / 2**20:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
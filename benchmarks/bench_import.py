@@ -0,0 +1,59 @@
+# Benchmark do tempo de importação a frio do motor de combinações.
+#
+# Cada medição roda em um interpretador novo para que nenhum módulo já esteja em cache.
+# Uso: python benchmarks/bench_import.py [--repeat N]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que não podem ser carregados junto com o motor
+FORBIDDEN_MODULES = ["streamlit", "pandas", "openpyxl"]
+
+PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+import load_combinations
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (FORBIDDEN_MODULES,)
+
+
+# Função para medir uma importação a frio em um subprocesso isolado
+def measure_once():
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de importação a frio do motor")
+    parser.add_argument("--repeat", type=int, default=10, help="Número de importações a frio")
+    args = parser.parse_args()
+
+    timings = []
+    loaded = set()
+    for _ in range(args.repeat):
+        sample = measure_once()
+        timings.append(sample["elapsed"] * 1000)
+        loaded.update(sample["loaded"])
+
+    print(f"Importação a frio de load_combinations ({args.repeat} execuções)")
+    print(f"  mínimo:  {min(timings):.2f} ms")
+    print(f"  mediana: {statistics.median(timings):.2f} ms")
+    print(f"  máximo:  {max(timings):.2f} ms")
+
+    if loaded:
+        print(f"ERRO: módulos pesados importados pelo motor: {', '.join(sorted(loaded))}")
+        sys.exit(1)
+    print(f"OK: nenhum de {', '.join(FORBIDDEN_MODULES)} foi importado")
+
+
+if __name__ == "__main__":
+    main()
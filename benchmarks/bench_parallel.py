@@ -0,0 +1,60 @@
+# Benchmark da geração paralela por família contra a geração serial.
+#
+# O pool é criado uma vez e reaproveitado (como em um servidor ou no lote); o custo de
+# criação do pool é informado à parte. Os caches de estrutura são limpos a cada medição.
+# Uso: python benchmarks/bench_parallel.py [--sizes 50 100 200] [--workers N]
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from synthetic import ALL_TYPES, make_loads
+
+from load_combinations.engine import _build_structure, combination_structure
+from load_combinations.factors import _build_factor_table
+from load_combinations.parallel import build_structure_parallel
+
+
+def clear_caches():
+    _build_structure.cache_clear()
+    _build_factor_table.cache_clear()
+
+
+# Função para medir o menor tempo de `repeat` execuções
+def best_time(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Geração paralela por família contra serial")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 300])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}, workers: {args.workers}")
+    start = time.perf_counter()
+    process_pool = ProcessPoolExecutor(max_workers=args.workers)
+    list(process_pool.map(abs, range(args.workers)))
+    print(f"criação do pool de processos: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+    thread_pool = ThreadPoolExecutor(max_workers=args.workers)
+
+    print(f"{'cargas':>7} {'combinações':>12} {'serial [s]':>11} {'threads [s]':>12} {'processos [s]':>14} {'ganho':>7}")
+    with process_pool, thread_pool:
+        for n in args.sizes:
+            loads = make_loads(n)
+            count = len(combination_structure(loads, ALL_TYPES))
+            t_serial = best_time(lambda: combination_structure(loads, ALL_TYPES), args.repeat)
+            t_thread = best_time(lambda: build_structure_parallel(loads, ALL_TYPES, executor=thread_pool), args.repeat)
+            t_process = best_time(lambda: build_structure_parallel(loads, ALL_TYPES, executor=process_pool), args.repeat)
+            print(f"{n:>7} {count:>12} {t_serial:>11.3f} {t_thread:>12.3f} {t_process:>14.3f} {t_serial / t_process:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Teste de carga do serviço HTTP/JSON (python -m load_combinations serve).
+#
+# Sobe uma instância local, dispara clientes simultâneos por --duration segundos em cada
+# nível de concorrência e reporta vazão (respostas 200 por segundo), latência p50/p99 e as
+# requisições recusadas com 503 pela contrapressão (o cliente recusado espera o Retry-After,
+# com variação aleatória, antes de tentar de novo). Cada requisição usa valores de carga
+# aleatórios sobre a mesma estrutura, então não é servida pelo cache de respostas (a menos
+# que --repeat-share > 0).
+#
+# Uso: python benchmarks/bench_server.py [--clients 1 10 50 100 200] [--loads 20] [--duration 5]
+#      python benchmarks/bench_server.py --url http://127.0.0.1:8765   (instância já em execução)
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+
+from bench_ui import free_port
+from synthetic import ROOT, make_loads
+
+
+# Função para subir o serviço e esperar o /health
+def start_service(port, workers, queue):
+    command = [sys.executable, "-m", "load_combinations", "serve", "--port", str(port)]
+    if workers:
+        command += ["--workers", str(workers)]
+    if queue is not None:
+        command += ["--queue", str(queue)]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("O serviço não respondeu")
+
+
+# Função para montar o corpo de uma requisição; com probabilidade `repeat_share` repete o
+# projeto base (atendido pelo cache)
+def request_body(loads, rng, repeat_share):
+    if rng.random() >= repeat_share:
+        loads = [dict(load, value=round(rng.uniform(0.1, 5.0), 2)) for load in loads]
+    project = [{key: load[key] for key in ("name", "category", "value", "direction", "action_type")} for load in loads]
+    return json.dumps({"loads": project})
+
+
+# Função para medir um nível de concorrência
+async def run_level(url, clients, duration, loads, repeat_share):
+    AsyncHTTPClient.configure(None, max_clients=clients)
+    http = AsyncHTTPClient(force_instance=True)
+    latencies = []
+    statuses = {}
+    deadline = time.perf_counter() + duration
+
+    async def client(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            body = request_body(loads, rng, repeat_share)
+            start = time.perf_counter()
+            retry_after = 0.05
+            try:
+                response = await http.fetch(f"{url}/combinations", method="POST", body=body, request_timeout=120)
+                status = response.code
+            except HTTPClientError as exc:
+                status = exc.code
+                if exc.response is not None and "Retry-After" in exc.response.headers:
+                    retry_after = float(exc.response.headers["Retry-After"]) * rng.uniform(0.5, 1.5)
+            elapsed = time.perf_counter() - start
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 200:
+                latencies.append(elapsed)
+            else:
+                await asyncio.sleep(min(retry_after, max(0.0, deadline - time.perf_counter())))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(seed) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    http.close()
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(503, 0),
+        "errors": sum(count for status, count in statuses.items() if status not in (200, 503)),
+        "throughput": statuses.get(200, 0) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000 if latencies else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do serviço de combinações")
+    parser.add_argument("--url", help="Instância já em execução (padrão: sobe uma local)")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50, 100, 200])
+    parser.add_argument("--loads", type=int, default=20, help="Cargas por projeto")
+    parser.add_argument("--duration", type=float, default=5.0, help="Segundos por nível")
+    parser.add_argument("--repeat-share", type=float, default=0.0, help="Fração de requisições repetidas (cache)")
+    parser.add_argument("--workers", type=int, help="Workers da instância local")
+    parser.add_argument("--queue", type=int, help="Fila da instância local")
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        process = start_service(port, args.workers, args.queue)
+        url = f"http://127.0.0.1:{port}"
+    loads = make_loads(args.loads)
+    try:
+        results = [asyncio.run(run_level(url, clients, args.duration, loads, args.repeat_share))
+                   for clients in args.clients]
+        health = json.load(urllib.request.urlopen(f"{url}/health"))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    if args.json:
+        print(json.dumps({"health": health, "results": results}, indent=2))
+        return
+    print(f"{url}: {health['workers']} workers, limite {health['limit']} em andamento, {os.cpu_count()} CPUs")
+    print(f"{'clientes':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'200':>7} {'503':>7} {'erros':>6}")
+    for r in results:
+        print(f"{r['clients']:>8} {r['throughput']:>8.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+              f"{r['ok']:>7} {r['rejected']:>7} {r['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
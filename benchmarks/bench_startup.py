@@ -0,0 +1,85 @@
+# Benchmark de partida a frio da interface Streamlit: tempo até o primeiro desenho em um
+# servidor recém-iniciado (inclui as importações do app), tempo do primeiro desenho de
+# uma segunda sessão e memória residente (RSS) do servidor por sessão aberta.
+#
+# Uso: python benchmarks/bench_startup.py [--app app.py] [--sessions 20] [--rounds 3]
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from tornado.websocket import websocket_connect
+
+from bench_ui import Session, free_port, start_server
+from synthetic import ROOT
+
+
+# Função para ler a memória residente de um processo (Linux)
+def rss_mb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+# Função para abrir uma sessão e esperar o primeiro desenho; retorna (segundos, sessão)
+async def first_render(port):
+    start = time.perf_counter()
+    connection = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_message_size=1 << 30)
+    session = Session(connection)
+    await session.rerun()
+    return time.perf_counter() - start, session
+
+
+# Função para medir um servidor recém-iniciado
+async def measure(pid, port, sessions):
+    rss_idle = rss_mb(pid)
+    cold, first = await first_render(port)
+    rss_first = rss_mb(pid)
+    warm, second = await first_render(port)
+    opened = [first, second]
+    rss_before = rss_mb(pid)
+    for _ in range(sessions):
+        opened.append((await first_render(port))[1])
+    rss_after = rss_mb(pid)
+    for session in opened:
+        session.connection.close()
+    return {
+        "cold_ms": cold * 1000,
+        "warm_ms": warm * 1000,
+        "rss_idle_mb": rss_idle,
+        "rss_first_mb": rss_first,
+        "per_session_mb": (rss_after - rss_before) / sessions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partida a frio e memória por sessão do app")
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="Servidores iniciados (vale a mediana)")
+    args = parser.parse_args()
+
+    results = []
+    for _ in range(args.rounds):
+        port = free_port()
+        process = start_server(os.path.abspath(args.app), port)
+        try:
+            results.append(asyncio.run(measure(process.pid, port, args.sessions)))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(os.path.basename(args.app))
+    for name, label in (("cold_ms", "primeiro desenho, servidor novo (ms)"),
+                        ("warm_ms", "primeiro desenho, segunda sessão (ms)"),
+                        ("rss_idle_mb", "RSS do servidor antes da 1ª sessão (MiB)"),
+                        ("rss_first_mb", "RSS após a 1ª sessão (MiB)"),
+                        ("per_session_mb", "RSS por sessão adicional (MiB)")):
+        print(f"  {label:<45} {statistics.median(r[name] for r in results):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
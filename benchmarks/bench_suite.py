@@ -0,0 +1,254 @@
+# Suíte de benchmarks do pipeline de combinações, etapa por etapa:
+#   structure   -> enumeração das combinações (caches de estruturas e fatores limpos a cada execução)
+#   q           -> cálculo vetorizado de Q (CombinationSet.q_values)
+#   calculate_q -> cálculo de Q pelo parser de strings original (engine.calculate_q)
+#   rows        -> linhas da tabela (CombinationSet.to_rows)
+#   dataframe   -> DataFrame colunar (export.combinations_dataframe)
+#   excel       -> gravação .xlsx (export.write_xlsx)
+#
+# As etapas q, rows e dataframe rodam sobre uma cópia do conjunto com os caches preguiçosos
+# vazios (rótulos, códigos e termos), então toda repetição, inclusive a medida sob
+# tracemalloc, mede a etapa a frio.
+#
+# Para cada caso (número de cargas x mistura de categorias x tipos selecionados) registra o
+# tempo (mínimo de --repeat execuções) e, em uma execução separada sob tracemalloc, a
+# memória alocada que permanece, o pico de memória e os blocos alocados.
+#
+# Os resultados são gravados em JSON. Com --baseline, cada etapa é comparada com o valor
+# gravado e a suíte termina com código 1 se alguma ficar mais lenta (ou usar mais memória)
+# que o limite configurado.
+#
+# Uso:
+#   python benchmarks/bench_suite.py --output resultados.json
+#   python benchmarks/bench_suite.py --baseline benchmarks/baseline.json [--threshold 0.25]
+#   python benchmarks/bench_suite.py --baseline benchmarks/baseline.json --save-baseline
+#   python benchmarks/bench_suite.py --subsets todos --sizes 4 10 --stages structure q
+import argparse
+import copy
+import gc
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from synthetic import ALL_TYPES, make_loads
+
+from load_combinations import calculate_q, combination_structure
+from load_combinations.engine import _build_structure
+from load_combinations.export import combinations_dataframe, write_xlsx
+from load_combinations.factors import _build_factor_table
+
+SIZES = [4, 10, 25, 50, 100]
+
+MIXES = {
+    "padrao": {"permanente": 0.3, "variavel": 0.4, "vento": 0.25, "excepcional": 0.05},
+    "permanentes": {"permanente": 0.8, "variavel": 0.2},
+    "vento": {"permanente": 0.2, "variavel": 0.2, "vento": 0.6},
+    "excepcional": {"permanente": 0.3, "variavel": 0.3, "vento": 0.1, "excepcional": 0.3},
+}
+
+
+# Função para listar os subconjuntos de tipos: "padrao" (todos os tipos e cada tipo
+# isolado) ou "todos" (os 511 subconjuntos não vazios)
+def type_subsets(mode):
+    if mode == "todos":
+        return [list(subset) for size in range(1, len(ALL_TYPES) + 1)
+                for subset in itertools.combinations(ALL_TYPES, size)]
+    return [list(ALL_TYPES)] + [[selected_type] for selected_type in ALL_TYPES]
+
+
+# Função para nomear um subconjunto de tipos de forma curta e estável
+def subset_name(subset):
+    if len(subset) == len(ALL_TYPES):
+        return "todos"
+    return "+".join(str(ALL_TYPES.index(selected_type)) for selected_type in subset)
+
+
+# Função para obter o conjunto do caso com os caches preguiçosos vazios. Os caches são
+# compartilhados entre cópias, então a cópia recebe dicionários novos.
+def cold_set(context):
+    cset = copy.copy(context["cset"])
+    cset._labels, cset._codes, cset._term_arrays = {}, {}, {}
+    return cset
+
+
+# Etapas do pipeline; cada uma recebe e completa o contexto do caso
+def stage_structure(context):
+    _build_structure.cache_clear()
+    _build_factor_table.cache_clear()
+    context["cset"] = combination_structure(context["loads"], context["types"]).with_loads(context["loads"])
+
+
+def stage_q(context):
+    cold_set(context).q_values()
+
+
+def stage_calculate_q(context):
+    loads = context["loads"]
+    cset = context["cset"]
+    for i in range(len(cset)):
+        calculate_q(loads, cset.combination_str(i))
+
+
+def stage_rows(context):
+    context["rows"] = cold_set(context).to_rows()
+
+
+def stage_dataframe(context):
+    context["df"] = combinations_dataframe(cold_set(context))
+
+
+def stage_excel(context):
+    write_xlsx(context["rows"], io.BytesIO())
+
+
+STAGES = {
+    "structure": stage_structure,
+    "q": stage_q,
+    "calculate_q": stage_calculate_q,
+    "rows": stage_rows,
+    "dataframe": stage_dataframe,
+    "excel": stage_excel,
+}
+
+
+# Função para medir uma etapa: tempo mínimo e memória sob tracemalloc
+def measure_stage(stage, context, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        stage(context)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    current_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    stage(context)
+    current_after, peak = tracemalloc.get_traced_memory()
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    return {
+        "seconds": min(times),
+        "retained_bytes": current_after - current_before,
+        "peak_bytes": peak - current_before,
+        "blocks": blocks_after - blocks_before,
+    }
+
+
+# Função para rodar a suíte; retorna a lista de medições
+def run_suite(sizes, mixes, subsets, stages, repeat, progress=None):
+    results = []
+    for n, mix, types in itertools.product(sizes, mixes, subsets):
+        context = {"loads": make_loads(n, MIXES[mix], seed=n), "types": types}
+        case = {"loads": n, "mix": mix, "types": subset_name(types)}
+        for stage in STAGES:
+            # As etapas seguintes dependem da saída das anteriores; etapas fora da seleção
+            # rodam uma vez, sem medição
+            if stage not in stages:
+                STAGES[stage](context)
+                continue
+            measurement = measure_stage(STAGES[stage], context, repeat)
+            results.append(dict(case, stage=stage, combinations=len(context["cset"]), **measurement))
+        if progress:
+            progress(case)
+    return results
+
+
+# Função para identificar uma medição na comparação com a referência
+def result_key(result):
+    return f"{result['loads']}|{result['mix']}|{result['types']}|{result['stage']}"
+
+
+# Função para comparar com a referência; retorna a lista de regressões
+def compare(results, baseline, threshold, memory_threshold, min_delta):
+    reference = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        base = reference.get(result_key(result))
+        if base is None:
+            continue
+        slower = result["seconds"] - base["seconds"]
+        if result["seconds"] > base["seconds"] * (1 + threshold) and slower > min_delta:
+            regressions.append((result, "seconds", base["seconds"], result["seconds"]))
+        if memory_threshold is not None and base["peak_bytes"] > 0:
+            if result["peak_bytes"] > base["peak_bytes"] * (1 + memory_threshold):
+                regressions.append((result, "peak_bytes", base["peak_bytes"], result["peak_bytes"]))
+    return regressions
+
+
+# Função para resumir as medições por etapa e número de cargas
+def print_summary(results):
+    print(f"{'etapa':<12} {'cargas':>6} {'casos':>6} {'comb. máx':>9} {'tempo total ms':>15} {'pico máx KiB':>13}")
+    groups = {}
+    for result in results:
+        groups.setdefault((result["stage"], result["loads"]), []).append(result)
+    for (stage, n), group in sorted(groups.items(), key=lambda item: (list(STAGES).index(item[0][0]), item[0][1])):
+        print(f"{stage:<12} {n:>6} {len(group):>6} {max(r['combinations'] for r in group):>9} "
+              f"{sum(r['seconds'] for r in group) * 1000:>15.2f} {max(r['peak_bytes'] for r in group) / 1024:>13.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks do gerador de combinações")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Números de cargas")
+    parser.add_argument("--mixes", nargs="+", default=list(MIXES), choices=list(MIXES))
+    parser.add_argument("--subsets", default="padrao", choices=["padrao", "todos"],
+                        help="Tipos selecionados: todos e cada um isolado, ou os 511 subconjuntos")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por etapa (vale o menor tempo)")
+    parser.add_argument("--output", help="Arquivo JSON para gravar os resultados")
+    parser.add_argument("--baseline", help="Arquivo JSON de referência para detectar regressões")
+    parser.add_argument("--save-baseline", action="store_true", help="Grava os resultados como a nova referência")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Aumento de tempo tolerado em relação à referência (0.25 = 25%%)")
+    parser.add_argument("--memory-threshold", type=float, default=None,
+                        help="Aumento de pico de memória tolerado (desligado por padrão)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="Diferenças de tempo menores que isso nunca contam como regressão")
+    args = parser.parse_args()
+
+    subsets = type_subsets(args.subsets)
+    total = len(args.sizes) * len(args.mixes) * len(subsets)
+    done = itertools.count(1)
+    results = run_suite(args.sizes, args.mixes, subsets, args.stages, args.repeat,
+                        progress=lambda case: print(f"\r{next(done)}/{total} casos", end="", file=sys.stderr))
+    print(file=sys.stderr)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print_summary(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Referência gravada em {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("platform") != report["platform"] or baseline.get("cpus") != report["cpus"]:
+            print(f"Aviso: referência medida em outra máquina ({baseline.get('platform')}, {baseline.get('cpus')} CPUs)")
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold, args.min_delta_ms / 1000)
+        for result, metric, before, after in regressions:
+            print(f"REGRESSÃO {result_key(result)} {metric}: {before:.6g} -> {after:.6g} ({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"Sem regressões em relação a {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
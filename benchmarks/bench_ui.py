@@ -0,0 +1,186 @@
+# Benchmark da latência por interação da interface Streamlit.
+#
+# Sobe o app em um servidor headless, conecta pelo mesmo websocket usado pelo navegador e
+# reproduz o que o navegador enviaria em cada interação (edição de um campo de carga,
+# marcação de um tipo de combinação, clique em "Gerar Combinações"). Mede o tempo até o
+# fim da execução do script no servidor e os bytes devolvidos ao cliente.
+# Widgets dentro de formulários não disparam execução até o envio (latência 0); widgets
+# dentro de fragmentos disparam só a execução do fragmento, como no navegador.
+#
+# Uso: python benchmarks/bench_ui.py [--app app.py] [--loads 10 50] [--repeat 5]
+#   Para comparar com outra versão: git show <rev>:app.py > /tmp/app_antes.py e
+#   python benchmarks/bench_ui.py --app /tmp/app_antes.py
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from tornado.websocket import websocket_connect
+
+from synthetic import ROOT
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+LOADS_LABEL = "Quantidade de carregamentos"
+CHECKBOX_LABEL = "ELU Rara (Resistência)"
+BUTTON_LABEL = "Gerar Combinações"
+
+
+# Função para escolher uma porta TCP livre
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# Função para subir o servidor Streamlit e esperar o health check
+def start_server(app, port):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("O servidor Streamlit não respondeu")
+
+
+# Sessão de navegador simulada: guarda os widgets vistos (id, formulário, fragmento)
+class Session:
+    def __init__(self, connection):
+        self.connection = connection
+        self.widgets = {}
+
+    async def rerun(self, states=(), fragment_id=""):
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        message.rerun_script.fragment_id = fragment_id
+        message.rerun_script.widget_states.widgets.extend(states)
+        start = time.perf_counter()
+        await self.connection.write_message(message.SerializeToString(), binary=True)
+        received = 0
+        while True:
+            data = await self.connection.read_message()
+            if data is None:
+                raise RuntimeError("Conexão encerrada pelo servidor")
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                self._record(forward.delta)
+            elif kind == "script_finished":
+                return time.perf_counter() - start, received
+
+    def _record(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        widget = getattr(element, kind)
+        if kind in ("markdown", "alert", "heading", "empty") or not getattr(widget, "id", ""):
+            return
+        self.widgets[widget.id] = {
+            "label": getattr(widget, "label", ""),
+            "form_id": getattr(widget, "form_id", ""),
+            "fragment_id": delta.fragment_id,
+        }
+
+    def find(self, label=None, key=None):
+        for widget_id, widget in self.widgets.items():
+            if key is not None and widget_id.endswith("-" + key):
+                return widget_id, widget
+            if label is not None and widget["label"].startswith(label):
+                return widget_id, widget
+        raise KeyError(label or key)
+
+    # Interação com um widget: dentro de formulário não há execução até o envio
+    async def interact(self, state, widget):
+        if widget["form_id"]:
+            return 0.0, 0
+        return await self.rerun([state], widget["fragment_id"])
+
+
+# Função para montar o estado de um widget como o navegador enviaria
+def widget_state(widget_id, **value):
+    state = WidgetState(id=widget_id)
+    for field, field_value in value.items():
+        setattr(state, field, field_value)
+    return state
+
+
+# Função para medir as interações com `n_loads` cargas
+async def measure(port, n_loads, repeat):
+    connection = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_message_size=1 << 30)
+    session = Session(connection)
+    await session.rerun()
+    loads_id, _ = session.find(label=LOADS_LABEL)
+    first_run = await session.rerun([widget_state(loads_id, int_value=n_loads)])
+    value_id, value_widget = session.find(key="value_0")
+    await session.interact(widget_state(value_id, double_value=1.0), value_widget)
+
+    results = {"loads": n_loads, "first_run_s": first_run[0], "first_run_bytes": first_run[1]}
+    name_id, name_widget = session.find(key=f"name_{n_loads // 2}")
+    checkbox_id, checkbox_widget = session.find(label=CHECKBOX_LABEL)
+    button_id, button_widget = session.find(label=BUTTON_LABEL)
+    interactions = {
+        "editar_nome": lambda i: session.interact(widget_state(name_id, string_value=f"Carga {i}"), name_widget),
+        "marcar_tipo": lambda i: session.interact(widget_state(checkbox_id, bool_value=bool(i % 2)), checkbox_widget),
+        "gerar": lambda i: session.rerun([widget_state(button_id, trigger_value=True)], button_widget["fragment_id"]),
+    }
+    for name, interaction in interactions.items():
+        samples = [await interaction(i) for i in range(repeat)]
+        results[name] = {
+            "median_ms": statistics.median(s[0] for s in samples) * 1000,
+            "max_ms": max(s[0] for s in samples) * 1000,
+            "bytes": int(statistics.median(s[1] for s in samples)),
+        }
+    connection.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--loads", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    port = free_port()
+    process = start_server(os.path.abspath(args.app), port)
+    try:
+        results = [asyncio.run(measure(port, n, args.repeat)) for n in args.loads]
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{os.path.basename(args.app)}")
+    print(f"{'cargas':>6}  {'interação':<12} {'mediana ms':>10} {'máx ms':>8} {'bytes':>9}")
+    for result in results:
+        for name in ("editar_nome", "marcar_tipo", "gerar"):
+            row = result[name]
+            print(f"{result['loads']:>6}  {name:<12} {row['median_ms']:>10.1f} {row['max_ms']:>8.1f} {row['bytes']:>9}")
+
+
+if __name__ == "__main__":
+    main()
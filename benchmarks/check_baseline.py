@@ -0,0 +1,113 @@
+# Verificação da saída de generate_combinations contra o motor original (baseline_engine),
+# coluna a coluna e com igualdade exata, inclusive Q. Confere também as demais vias que
+# calculam Q (iter_rows, DataFrame colunar, conjunto podado e avaliação de cenários)
+# contra a mesma referência.
+#
+# Uso: python benchmarks/check_baseline.py [--cases N] [--large 40 60] [--scenarios 3]
+import argparse
+import random
+import sys
+
+import numpy as np
+
+from synthetic import ALL_TYPES, make_loads
+
+import baseline_engine
+
+from load_combinations import build_combination_set, generate_combinations
+from load_combinations.engine import iter_rows
+from load_combinations.export import combinations_dataframe
+from load_combinations.project import make_load
+from load_combinations.scenarios import evaluate_scenarios
+
+
+# Função para comparar as linhas de uma via com as do motor original; retorna as divergências
+def compare_rows(name, rows, expected):
+    if len(rows) != len(expected):
+        return [f"{name}: {len(rows)} linhas != {len(expected)}"]
+    problems = []
+    for row, reference in zip(rows, expected):
+        if list(row) != list(reference):
+            problems.append(f"{name}: {list(row)} != {list(reference)}")
+            if len(problems) >= 5:
+                break
+    return problems
+
+
+# Função para conferir a avaliação de cenários: cada linha de Q, o máximo e o mínimo (com
+# o Nº da primeira combinação que os atinge) devem ser os da tabela do motor original
+# gerada com os valores do cenário
+def compare_scenarios(loads, selected_types, values):
+    evaluation = evaluate_scenarios(build_combination_set(loads, selected_types), values)
+    problems = []
+    for scenario, row in enumerate(values.tolist()):
+        scenario_loads = [
+            make_load(load["name"], load["category"], abs(value), "Negativa" if value < 0 else "Positiva", load["action_type"])
+            for load, value in zip(loads, row)
+        ]
+        table = baseline_engine.generate_combinations(scenario_loads, selected_types)
+        q = [line[5] for line in table]
+        governing_max = table[q.index(max(q))]
+        governing_min = table[q.index(min(q))]
+        if evaluation["q"][scenario].tolist() != q:
+            problems.append(f"cenário {scenario}: Q diverge da tabela")
+        elif (evaluation["max_q"][scenario], evaluation["max_combination"][scenario]) != (governing_max[5], governing_max[0]):
+            problems.append(f"cenário {scenario}: máximo diverge da tabela (Nº {governing_max[0]})")
+        elif (evaluation["min_q"][scenario], evaluation["min_combination"][scenario]) != (governing_min[5], governing_min[0]):
+            problems.append(f"cenário {scenario}: mínimo diverge da tabela (Nº {governing_min[0]})")
+    return problems
+
+
+# Função para conferir um conjunto de cargas em todas as vias
+def compare(loads, selected_types, scenarios):
+    expected = baseline_engine.generate_combinations(loads, selected_types)
+    problems = compare_rows("generate_combinations", generate_combinations(loads, selected_types), expected)
+    problems += compare_rows("iter_rows", list(iter_rows(loads, selected_types)), expected)
+
+    combination_set = build_combination_set(loads, selected_types)
+    q_frame = combinations_dataframe(combination_set)["Q [kN/m²]"].tolist()
+    if q_frame != [row[5] for row in expected]:
+        problems.append("DataFrame colunar: coluna Q diverge")
+    rows = list(range(0, len(combination_set), 3))
+    q_subset = combination_set.take(rows).q_values().tolist()
+    if q_subset != [expected[row][5] for row in rows]:
+        problems.append("subconjunto (take): Q diverge")
+    if expected:
+        problems += compare_scenarios(loads, selected_types, scenarios)
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generate_combinations contra o motor original")
+    parser.add_argument("--cases", type=int, default=300, help="Casos aleatórios verificados")
+    parser.add_argument("--large", type=int, nargs="+", default=[40, 60], help="Tamanhos dos casos grandes")
+    parser.add_argument("--scenarios", type=int, default=3, help="Cenários de valores avaliados por caso")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = []
+    for _ in range(args.cases):
+        n = rng.randint(1, 30)
+        mix = {group: rng.random() for group in ("permanente", "variavel", "vento", "excepcional")}
+        loads = make_loads(n, mix=mix, seed=rng.random(), negative_share=rng.random())
+        cases.append((loads, [t for t in ALL_TYPES if rng.random() < 0.6]))
+    cases += [(make_loads(n, negative_share=0.3), ALL_TYPES) for n in args.large]
+
+    failures = 0
+    for case, (loads, selected_types) in enumerate(cases):
+        scenarios = np.array([[round(rng.uniform(-5.0, 5.0), 2) for _ in loads] for _ in range(args.scenarios)])
+        problems = compare(loads, selected_types, scenarios)
+        if problems:
+            failures += 1
+            print(f"caso {case} ({len(loads)} cargas, {selected_types}):")
+            for problem in problems:
+                print(f"  {problem}")
+    print(f"{len(cases) - failures}/{len(cases)} casos conferem com o motor original")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
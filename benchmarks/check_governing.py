@@ -0,0 +1,81 @@
+# Verificação e benchmark da busca direta da combinação governante (governing.find_governing)
+# contra a enumeração completa, em conjuntos de cargas aleatórios: Q e, em empates, o mesmo
+# Nº (o menor, o primeiro que a enumeração encontra).
+#
+# Uso: python benchmarks/check_governing.py [--cases N] [--sizes 10 30 60 100]
+import argparse
+import random
+import sys
+import time
+
+from synthetic import ALL_TYPES, make_loads
+
+from load_combinations.governing import brute_force_governing, find_governing
+
+
+def _by_key(governing):
+    return {(g.type_state, g.criterion, g.sense): g for g in governing}
+
+
+# Função para comparar as duas respostas; retorna a lista de divergências
+def compare(loads, selected_types):
+    direct = _by_key(find_governing(loads, selected_types))
+    reference = _by_key(brute_force_governing(loads, selected_types))
+    problems = []
+    if direct.keys() != reference.keys():
+        problems.append(f"grupos diferentes: {sorted(direct)} != {sorted(reference)}")
+        return problems
+    for key, expected in reference.items():
+        found = direct[key]
+        if found.q != expected.q:
+            problems.append(f"{key}: Q {found.q} (Nº {found.combination.number}) != {expected.q} (Nº {expected.combination.number})")
+        elif found.combination.number != expected.combination.number:
+            # Em empates vale o menor Nº, o primeiro que a enumeração encontra
+            problems.append(f"{key}: empate em Q {found.q} resolvido com Nº {found.combination.number}, esperado Nº {expected.combination.number}")
+        elif found.combination != expected.combination:
+            problems.append(f"{key}: fatores divergentes para Nº {found.combination.number}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca direta da combinação governante contra enumeração")
+    parser.add_argument("--cases", type=int, default=500, help="Casos aleatórios verificados")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 60, 100, 200], help="Tamanhos para a medição de tempo")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failures = 0
+    for case in range(args.cases):
+        n = rng.randint(1, 40)
+        mix = {group: rng.random() for group in ("permanente", "variavel", "vento", "excepcional")}
+        loads = make_loads(n, mix=mix, seed=rng.random(), negative_share=rng.random())
+        # Metade dos casos com poucos valores distintos, para forçar empates em Q
+        if case % 2:
+            loads = [dict(load, value=rng.choice([1.0, 2.0])) for load in loads]
+        selected_types = [t for t in ALL_TYPES if rng.random() < 0.6]
+        problems = compare(loads, selected_types)
+        if problems:
+            failures += 1
+            print(f"caso {case} ({n} cargas, {selected_types}):")
+            for problem in problems:
+                print(f"  {problem}")
+    print(f"{args.cases - failures}/{args.cases} casos aleatórios conferem com a enumeração")
+
+    print(f"\n{'cargas':>7} {'enumeração [ms]':>16} {'busca direta [ms]':>18} {'ganho':>8}")
+    for n in args.sizes:
+        loads = make_loads(n, negative_share=0.3)
+        start = time.perf_counter()
+        brute_force_governing(loads, ALL_TYPES)
+        t_brute = time.perf_counter() - start
+        start = time.perf_counter()
+        find_governing(loads, ALL_TYPES)
+        t_direct = time.perf_counter() - start
+        print(f"{n:>7} {t_brute * 1000:>16.2f} {t_direct * 1000:>18.2f} {t_brute / t_direct:>7.0f}x")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Geração de conjuntos de cargas sintéticos para os benchmarks.
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from load_combinations import ACTION_FACTORS, COMBINATION_TYPES  # noqa: E402
+from load_combinations.project import make_load  # noqa: E402
+
+ALL_TYPES = COMBINATION_TYPES
+
+# Proporções padrão de cada grupo de categorias em um conjunto sintético
+DEFAULT_MIX = {"permanente": 0.3, "variavel": 0.4, "vento": 0.25, "excepcional": 0.05}
+
+CATEGORY_GROUPS = {
+    "permanente": ["G_Me", "G_Pr", "G_Si", "G_Ec", "G_Eg", "SET"],
+    "variavel": ["Q_U", "Q_T", "Q_G"],
+    "vento": ["Q_V"],
+    "excepcional": ["Q_Exc"],
+}
+
+
+# Função para gerar n cargas com a mistura de categorias indicada
+def make_loads(n, mix=None, seed=0, negative_share=0.0):
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    groups = list(mix)
+    weights = [mix[g] for g in groups]
+    action_types = list(ACTION_FACTORS)
+    wind_action_type = "Pressão dinâmica do vento nas estruturas em geral"
+
+    loads = []
+    for i in range(n):
+        group = rng.choices(groups, weights)[0]
+        category = rng.choice(CATEGORY_GROUPS[group])
+        action_type = ""
+        if group == "vento":
+            action_type = wind_action_type
+        elif group == "variavel":
+            action_type = rng.choice(action_types)
+        direction = "Negativa" if rng.random() < negative_share else "Positiva"
+        loads.append(make_load(f"Carregamento {i + 1}", category, round(rng.uniform(0.1, 5.0), 2), direction, action_type))
+    return loads
@@ -0,0 +1,69 @@
+# Motor de combinações de carga conforme ABNT NBR 8800, independente da interface Streamlit.
+# Este pacote não deve importar streamlit, pandas nem openpyxl no carregamento.
+from load_combinations.tables import ACTION_CATEGORIES, ACTION_FACTORS, COMBINATION_TYPES
+from load_combinations.engine import (
+    COLUMNS,
+    FAMILIES,
+    Combination,
+    CombinationSet,
+    Family,
+    LoadGroups,
+    build_combination_set,
+    calculate_q,
+    combination_q,
+    combination_structure,
+    family_offsets,
+    format_combination,
+    generate_combinations,
+    group_loads,
+    iter_combinations,
+    iter_rows,
+    make_combination,
+    signed_values,
+    structure_key,
+)
+from load_combinations.cache import DiskCache, ResultCache, input_hash
+from load_combinations.factors import FREQUENCIES, factor_key, factor_table, get_factors
+from load_combinations.governing import GoverningCombination, find_governing
+from load_combinations.pruning import PrunedCombination, prune_combinations
+from load_combinations.project import ProjectError, load_project, make_load, parse_project
+
+__all__ = [
+    "ACTION_CATEGORIES",
+    "ACTION_FACTORS",
+    "COLUMNS",
+    "COMBINATION_TYPES",
+    "Combination",
+    "CombinationSet",
+    "DiskCache",
+    "FAMILIES",
+    "FREQUENCIES",
+    "Family",
+    "GoverningCombination",
+    "LoadGroups",
+    "ProjectError",
+    "PrunedCombination",
+    "ResultCache",
+    "build_combination_set",
+    "calculate_q",
+    "combination_q",
+    "combination_structure",
+    "factor_key",
+    "family_offsets",
+    "factor_table",
+    "find_governing",
+    "format_combination",
+    "generate_combinations",
+    "get_factors",
+    "group_loads",
+    "input_hash",
+    "iter_combinations",
+    "iter_rows",
+    "load_project",
+    "make_combination",
+    "make_load",
+    "parse_project",
+    "prune_combinations",
+    "signed_values",
+    "structure_key",
+]
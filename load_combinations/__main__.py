@@ -0,0 +1,5 @@
+import sys
+
+from load_combinations.cli import main
+
+sys.exit(main())
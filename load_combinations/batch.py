@@ -0,0 +1,101 @@
+import glob
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from load_combinations.engine import build_combination_set, iter_rows
+from load_combinations.project import load_project
+
+# Geração em lote: um projeto por arquivo, processados em um pool de processos.
+# Falhas de um projeto são registradas e não interrompem os demais.
+
+FORMATS = ["xlsx", "npz", "arrow"]
+PROJECT_PATTERNS = ["*.json", "*.csv", "*.xlsx"]
+
+
+# Função para listar os arquivos de projeto de um diretório, em ordem alfabética
+def find_projects(directory):
+    paths = set()
+    for pattern in PROJECT_PATTERNS:
+        paths.update(glob.glob(os.path.join(directory, pattern)))
+    return sorted(paths)
+
+
+# Função para gerar as combinações de um projeto e gravar os arquivos pedidos em
+# `output_dir/<nome do projeto>.<formato>`. Retorna um dicionário com o resultado e os
+# tempos de cada etapa; erros são devolvidos no resultado em vez de propagados.
+# Com `family_executor` (pool já existente, reaproveitado entre chamadas) as famílias são
+# enumeradas em paralelo nesse pool (ver load_combinations.parallel).
+def process_project(path, output_dir, formats=("xlsx",), remove_duplicates=False, remove_dominated=False,
+                    family_executor=None):
+    name = os.path.splitext(os.path.basename(path))[0]
+    result = {"project": name, "path": path, "ok": False, "combinations": 0, "outputs": [], "timings": {}}
+    start = time.perf_counter()
+    try:
+        stage = time.perf_counter()
+        loads, selected_types = load_project(path)
+        result["timings"]["load"] = time.perf_counter() - stage
+
+        stage = time.perf_counter()
+        if family_executor is not None:
+            from load_combinations.parallel import build_combination_set_parallel
+
+            combination_set = build_combination_set_parallel(loads, selected_types, executor=family_executor)
+        else:
+            combination_set = build_combination_set(loads, selected_types)
+        pruning = remove_duplicates or remove_dominated
+        if pruning:
+            from load_combinations.pruning import prune_combinations
+
+            combination_set, pruned = prune_combinations(combination_set, dominance=remove_dominated)
+            result["pruned"] = len(pruned)
+        result["combinations"] = len(combination_set)
+        result["timings"]["generate"] = time.perf_counter() - stage
+
+        os.makedirs(output_dir, exist_ok=True)
+        for output_format in formats:
+            stage = time.perf_counter()
+            output_path = os.path.join(output_dir, f"{name}.{output_format}")
+            if output_format == "xlsx":
+                from load_combinations.export import write_xlsx
+
+                # Linhas geradas uma a uma: a planilha é gravada sem montar a lista completa
+                rows = combination_set.iter_rows() if pruning or family_executor is not None else iter_rows(loads, selected_types)
+                with open(output_path, "wb") as f:
+                    write_xlsx(rows, f)
+            elif output_format in ("npz", "arrow"):
+                from load_combinations.columnar import save_columnar
+
+                save_columnar(combination_set, output_path)
+            else:
+                raise ValueError(f"Formato desconhecido: '{output_format}' (use {', '.join(FORMATS)})")
+            result["outputs"].append(output_path)
+            result["timings"][output_format] = time.perf_counter() - stage
+        result["ok"] = True
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        result["traceback"] = traceback.format_exc()
+    result["timings"]["total"] = time.perf_counter() - start
+    return result
+
+
+# Função para processar vários projetos em um pool de processos. Gera os resultados à
+# medida que terminam (fora de ordem); cada resultado segue o formato de process_project.
+def run_batch(paths, output_dir, formats=("xlsx",), workers=None, remove_duplicates=False, remove_dominated=False):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(process_project, path, output_dir, tuple(formats), remove_duplicates, remove_dominated): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield future.result()
+            except Exception as exc:
+                # Falha do próprio worker (ex.: processo encerrado), não do projeto
+                name = os.path.splitext(os.path.basename(path))[0]
+                yield {
+                    "project": name, "path": path, "ok": False, "combinations": 0, "outputs": [],
+                    "timings": {}, "error": f"{type(exc).__name__}: {exc}",
+                }
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+# Versão do formato das entradas em disco; incrementar quando o conteúdo em cache mudar
+# de forma incompatível (regras de combinação, colunas da tabela, formato do Excel)
+CACHE_VERSION = 6
+
+
+# Função para calcular o hash canônico das entradas que definem um resultado.
+# Apenas os campos que alteram a tabela entram na chave, e os tipos selecionados são
+# ordenados porque a geração só testa pertinência. O nome da carga não aparece na tabela e
+# só entra na chave com `names=True`, para resultados que o guardam (ex.: o .npz colunar).
+# `options` (dicionário serializável em JSON) distingue variações do mesmo cálculo.
+def input_hash(loads, selected_types, options=None, names=False):
+    payload = {
+        "loads": [
+            {
+                "category": load["category"],
+                "value": float(load["value"]),
+                "direction": load["direction"],
+                "action_type": load["action_type"],
+                "factors": [load["factors"]["ψ₀"], load["factors"]["ψ₁"], load["factors"]["ψ₂"]],
+                **({"name": load["name"]} if names else {}),
+            }
+            for load in loads
+        ],
+        "selected_types": sorted(set(selected_types)),
+        "options": options or {},
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Cache LRU de resultados em memória, seguro para uso entre threads (sessões Streamlit).
+# Entradas são descartadas por quantidade, por tamanho total em bytes e por idade.
+# Um `backing` opcional (ex.: DiskCache) é consultado nas falhas e recebe os novos valores.
+class ResultCache:
+    def __init__(self, max_entries=128, max_bytes=256 * 1024 * 1024, max_age=3600.0, clock=time.monotonic, backing=None):
+        self.backing = backing
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # chave -> (valor, tamanho, instante de criação)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry):
+        return self.max_age is not None and self._clock() - entry[2] > self.max_age
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        self.evictions += 1
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._drop(next(iter(self._entries)))
+
+    # Função para buscar um valor; retorna `default` em caso de falha ou entrada expirada
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    # Função para guardar um valor com seu tamanho aproximado em bytes
+    def put(self, key, value, size=0):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            self._evict()
+
+    # Função para obter o valor da chave ou calculá-lo com `factory` em caso de falha.
+    # `size_of` estima o tamanho do valor em bytes para o limite de memória.
+    def get_or_create(self, key, factory, size_of=None):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        if self.backing is not None:
+            value = self.backing.get(key, missing)
+        if value is missing:
+            value = factory()
+            if self.backing is not None:
+                self.backing.put(key, value)
+        self.put(key, value, size_of(value) if size_of else 0)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # Estatísticas de uso do cache
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# Cache persistente em disco: cada entrada é um arquivo pickle nomeado pela chave.
+# Gravações são atômicas (arquivo temporário + os.replace), de modo que processos
+# concorrentes nunca leem uma entrada parcial. A ordem LRU usa o mtime dos arquivos,
+# atualizado a cada leitura, e as entradas mais antigas são removidas acima de `max_bytes`.
+class DiskCache:
+    SUFFIX = ".pkl"
+
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024):
+        self.directory = os.path.join(directory, f"v{CACHE_VERSION}")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    # Função para buscar um valor; retorna `default` se a entrada não existir ou estiver ilegível
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Entrada de uma versão incompatível do código: descartar
+            self._remove(path)
+            self.misses += 1
+            return default
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return value
+
+    # Função para gravar um valor de forma atômica
+    def put(self, key, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=self.SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    # Lista (mtime, tamanho, caminho) das entradas completas
+    def _entries(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.startswith(".tmp-") or not entry.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                self.evictions += 1
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    # Estatísticas de uso do cache neste processo
+    def stats(self):
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,268 @@
+import argparse
+import sys
+import time
+
+from load_combinations.engine import build_combination_set
+from load_combinations.project import ProjectError, load_project
+
+
+# Subcomando "envelope": envoltórias de esforços por barra sobre as combinações do projeto
+def run_envelope(args):
+    from load_combinations.envelope import compute_envelope, open_results
+
+    loads, selected_types = load_project(args.project)
+    combination_set = build_combination_set(loads, selected_types)
+    results = open_results(args.results)
+    n_members, n_load_cases, n_components = results.shape
+
+    print(f"{n_members} barras × {n_load_cases} casos de carga × {n_components} componentes; {len(combination_set)} combinações")
+
+    def progress(done, total):
+        print(f"\r  {done}/{total} barras ({100 * done / total:.0f}%)", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    compute_envelope(
+        results, combination_set.coefficients, combination_set.numbers,
+        output_dir=args.output,
+        chunk_members=args.chunk,
+        memory_budget=args.memory_mb * 1024 * 1024,
+        progress=None if args.quiet else progress
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Envoltórias gravadas em {args.output} ({time.perf_counter() - start:.2f} s)")
+    return 0
+
+
+# Subcomando "scenarios": avalia vários vetores de valores de carga em uma única passagem
+def run_scenarios(args):
+    import os
+
+    import numpy as np
+
+    from load_combinations.scenarios import evaluate_scenarios, read_scenarios, write_governing_csv
+
+    loads, selected_types = load_project(args.project)
+    combination_set = build_combination_set(loads, selected_types)
+    names, values = read_scenarios(args.scenarios, loads)
+
+    start = time.perf_counter()
+    evaluation = evaluate_scenarios(combination_set, values)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.output, exist_ok=True)
+    np.save(os.path.join(args.output, "q.npy"), evaluation["q"])
+    np.save(os.path.join(args.output, "numbers.npy"), np.asarray(combination_set.numbers, dtype=np.int64))
+    write_governing_csv(os.path.join(args.output, "governing.csv"), names, evaluation)
+    print(f"{len(names)} cenários × {len(combination_set)} combinações avaliados em {elapsed * 1000:.1f} ms")
+    print(f"Resultados gravados em {args.output} (q.npy, numbers.npy, governing.csv)")
+    return 0
+
+
+# Subcomando "governing": combinações governantes por estado limite, sem enumeração completa
+def run_governing(args):
+    from load_combinations.engine import format_combination
+    from load_combinations.governing import find_governing
+
+    loads, selected_types = load_project(args.project)
+    for governing in find_governing(loads, selected_types):
+        combination = governing.combination
+        print(
+            f"{governing.type_state} {governing.criterion:<20} {governing.sense}  Q = {governing.q:>10.3f}  "
+            f"Nº {combination.number:<6} ({combination.frequency}) {format_combination(combination)}"
+        )
+    return 0
+
+
+def _formats(text):
+    from load_combinations.batch import FORMATS
+
+    formats = [item.strip() for item in text.split(",") if item.strip()]
+    unknown = [item for item in formats if item not in FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"formato desconhecido: {', '.join(unknown)} (use {', '.join(FORMATS)})")
+    return formats
+
+
+# Subcomando "generate": gera as combinações de um único projeto
+def run_generate(args):
+    from load_combinations.batch import process_project
+
+    if args.parallel:
+        import os
+
+        from load_combinations.engine import FAMILIES
+        from load_combinations.parallel import EXECUTORS
+
+        # Um único pool de famílias para o projeto, com no máximo uma posição por família
+        with EXECUTORS[args.parallel](max_workers=min(os.cpu_count() or 1, len(FAMILIES))) as pool:
+            result = process_project(args.project, args.output, args.formats, args.remove_duplicates,
+                                     args.remove_dominated, family_executor=pool)
+    else:
+        result = process_project(args.project, args.output, args.formats, args.remove_duplicates, args.remove_dominated)
+    if not result["ok"]:
+        print(f"Erro: {result['error']}", file=sys.stderr)
+        return 1
+    print(f"{result['combinations']} combinações em {result['timings']['total']:.2f} s")
+    for path in result["outputs"]:
+        print(f"  {path}")
+    return 0
+
+
+# Subcomando "batch": gera as combinações de todos os projetos de um diretório
+def run_batch(args):
+    import json
+    import os
+
+    from load_combinations.batch import find_projects, run_batch as batch
+
+    paths = find_projects(args.projects)
+    if not paths:
+        print(f"Nenhum projeto encontrado em {args.projects}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = []
+    for done, result in enumerate(batch(paths, args.output, args.formats, args.workers,
+                                        args.remove_duplicates, args.remove_dominated), start=1):
+        results.append(result)
+        prefix = f"[{done}/{len(paths)}] {result['project']}"
+        if result["ok"]:
+            print(f"{prefix}: {result['combinations']} combinações em {result['timings']['total']:.2f} s")
+        else:
+            print(f"{prefix}: FALHA - {result['error']}")
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if not result["ok"]]
+    results.sort(key=lambda result: result["project"])
+    os.makedirs(args.output, exist_ok=True)
+    report_path = os.path.join(args.output, "batch_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"elapsed": elapsed, "projects": results}, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{len(results) - len(failures)}/{len(results)} projetos gerados em {elapsed:.2f} s; relatório em {report_path}")
+    for result in failures:
+        print(f"  FALHA {result['project']}: {result['error']}")
+    return 1 if failures else 0
+
+
+# Subcomando "serve": serviço HTTP/JSON local (ver load_combinations.server)
+def run_serve(args):
+    import asyncio
+
+    from load_combinations.server import serve
+
+    def ready(service):
+        print(f"Servindo em http://{args.host}:{args.port} ({service.workers} workers, "
+              f"até {service.limit} requisições em andamento)", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, ready, workers=args.workers, queue_size=args.queue,
+                          executor=args.executor, cache_entries=args.cache_entries, parallel=args.parallel))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _add_output_options(parser):
+    parser.add_argument("-o", "--output", required=True, help="Diretório de saída")
+    parser.add_argument("--formats", type=_formats, default=["xlsx"],
+                        help="Formatos separados por vírgula: xlsx, npz, arrow (padrão: xlsx)")
+    parser.add_argument("--remove-duplicates", action="store_true", help="Remover combinações com fatores repetidos")
+    parser.add_argument("--remove-dominated", action="store_true",
+                        help="Remover combinações dominadas (todas as cargas devem ser positivas)")
+
+
+def _add_parallel_option(parser):
+    parser.add_argument("--parallel", choices=["thread", "process"],
+                        help="Enumerar as famílias de combinações em paralelo, em threads ou processos (padrão: serial)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m load_combinations",
+        description="Combinações de carga conforme ABNT NBR 8800"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser(
+        "generate",
+        help="Gera as combinações de um projeto",
+        description="Gera as combinações de um projeto (JSON ou tabela de cargas) e grava os arquivos nos formatos pedidos."
+    )
+    generate.add_argument("project", help="Arquivo de projeto JSON (loads, selected_types) ou tabela de cargas .csv/.xlsx")
+    _add_output_options(generate)
+    _add_parallel_option(generate)
+    generate.set_defaults(func=run_generate)
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Gera as combinações de todos os projetos de um diretório",
+        description="Processa cada projeto do diretório em um pool de processos, com progresso e tempo por "
+                    "projeto. Falhas não interrompem o lote; o relatório fica em batch_report.json."
+    )
+    batch.add_argument("projects", help="Diretório com os arquivos de projeto")
+    _add_output_options(batch)
+    batch.add_argument("-j", "--workers", type=int, help="Processos no pool (padrão: número de CPUs)")
+    batch.set_defaults(func=run_batch)
+
+    envelope = subparsers.add_parser(
+        "envelope",
+        help="Envoltórias máx./mín. de esforços por barra",
+        description="Aplica as combinações do projeto a um array .npy (barras × casos de carga × componentes) "
+                    "e grava max.npy, min.npy, max_combination.npy e min_combination.npy."
+    )
+    envelope.add_argument("project", help="Arquivo de projeto JSON (loads, selected_types) ou tabela de cargas .csv/.xlsx")
+    envelope.add_argument("results", help="Esforços por caso de carga (.npy, lido com memory-map)")
+    envelope.add_argument("-o", "--output", required=True, help="Diretório de saída")
+    envelope.add_argument("--chunk", type=int, help="Barras por bloco (padrão: calculado pelo orçamento de memória)")
+    envelope.add_argument("--memory-mb", type=int, default=256, help="Orçamento de memória por bloco em MB")
+    envelope.add_argument("-q", "--quiet", action="store_true", help="Não exibir progresso")
+    envelope.set_defaults(func=run_envelope)
+
+    scenarios = subparsers.add_parser(
+        "scenarios",
+        help="Avaliação em lote de vários conjuntos de valores de carga",
+        description="Avalia todos os cenários sobre a estrutura de combinações do projeto e grava "
+                    "q.npy (cenários × combinações), numbers.npy (Nº de cada coluna) e governing.csv."
+    )
+    scenarios.add_argument("project", help="Arquivo de projeto JSON (loads, selected_types) ou tabela de cargas .csv/.xlsx")
+    scenarios.add_argument("scenarios", help="Cenários (.csv com uma coluna por carga, ou .npy cenários × cargas)")
+    scenarios.add_argument("-o", "--output", required=True, help="Diretório de saída")
+    scenarios.set_defaults(func=run_scenarios)
+
+    governing = subparsers.add_parser(
+        "governing",
+        help="Combinações governantes (Q máx./mín.) por estado limite",
+        description="Encontra diretamente, em tempo linear no número de cargas, a combinação de Q máximo "
+                    "e mínimo de cada estado limite e critério, sem gerar a tabela completa."
+    )
+    governing.add_argument("project", help="Arquivo de projeto JSON (loads, selected_types) ou tabela de cargas .csv/.xlsx")
+    governing.set_defaults(func=run_governing)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Serviço HTTP/JSON local",
+        description="POST /combinations com {\"loads\": [...], \"selected_types\": [...]} devolve as mesmas linhas de "
+                    "generate_combinations. A geração roda em um pool limitado; acima do limite a resposta é 503."
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Endereço (padrão: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Porta (padrão: 8765)")
+    serve.add_argument("-j", "--workers", type=int, help="Processos no pool (padrão: número de CPUs)")
+    serve.add_argument("--queue", type=int, help="Requisições aguardando além das em execução (padrão: 2 × workers)")
+    serve.add_argument("--executor", choices=["process", "thread"],
+                       help="Pool das requisições (padrão: process; thread com --parallel, que não aceita process)")
+    serve.add_argument("--cache-entries", type=int, default=256, help="Respostas mantidas em cache")
+    _add_parallel_option(serve)
+    serve.set_defaults(func=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (ProjectError, ValueError, OSError) as exc:
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 1
@@ -0,0 +1,146 @@
+import io
+import json
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+# Exportação colunar binária do conjunto de combinações: matriz de fatores, Q e metadados.
+# Os formatos gravam os dados sem compressão para que ferramentas de pós-processamento
+# possam mapeá-los em memória e ler colunas de fatores sem cópia nem análise de texto.
+#
+#   .npz   -> arquivo NumPy (zip sem compressão); lido com open_npz
+#   .arrow -> Arrow IPC (requer pyarrow, já instalado como dependência do Streamlit); lido com open_arrow
+
+NPZ_MIME = "application/octet-stream"
+ARROW_EXTENSIONS = (".arrow", ".feather")
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+
+# Função para montar as colunas do conjunto de combinações.
+# `coefficients` é gravada em ordem Fortran: cada coluna (fatores de uma carga) é contígua.
+def columnar_arrays(combination_set):
+    loads = combination_set.loads
+    return {
+        "number": np.asarray(combination_set.numbers, dtype=np.int64),
+        "coefficients": np.asfortranarray(combination_set.coefficients, dtype=np.float64),
+        "q": np.asarray(combination_set.q_values(), dtype=np.float64),
+        "type_state": np.asarray(combination_set.type_states, dtype=str),
+        "frequency": np.asarray(combination_set.frequencies, dtype=str),
+        "criterion": np.asarray(combination_set.criteria, dtype=str),
+        "load_name": np.asarray([load["name"] for load in loads], dtype=str),
+        "load_category": np.asarray([load["category"] for load in loads], dtype=str),
+        "load_action_type": np.asarray([load["action_type"] for load in loads], dtype=str),
+        "load_value": np.asarray([load["value"] for load in loads], dtype=np.float64),
+        "load_sign": np.asarray([1 if load["direction"] == "Positiva" else -1 for load in loads], dtype=np.int8),
+    }
+
+
+# Função para gravar o conjunto em .npz sem compressão (caminho ou arquivo aberto)
+def save_npz(combination_set, file):
+    np.savez(file, **columnar_arrays(combination_set))
+
+
+# Função para obter os bytes do .npz, usada no botão de download
+def npz_bytes(combination_set):
+    output = io.BytesIO()
+    save_npz(combination_set, output)
+    return output.getvalue()
+
+
+# Função para abrir um .npz mapeando cada array em memória (np.memmap, somente leitura).
+# np.load não mapeia membros de .npz; aqui o deslocamento de cada .npy dentro do zip é
+# calculado a partir do cabeçalho local, o que só é possível para membros não comprimidos.
+def open_npz(path):
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                # Membro comprimido (ex.: np.savez_compressed): leitura normal, com cópia
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            f.seek(info.header_offset)
+            header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+            if header[0] != _LOCAL_HEADER_SIGNATURE:
+                raise ValueError(f"Cabeçalho zip inválido para '{info.filename}' em {path}")
+            name_length, extra_length = header[-2], header[-1]
+            f.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"O array '{name}' contém objetos Python e não pode ser mapeado")
+
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype, order="F" if fortran_order else "C")
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=f.tell(), shape=shape, order="F" if fortran_order else "C"
+                )
+    return arrays
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("A exportação Arrow requer o pacote pyarrow (pip install pyarrow)") from exc
+    return pyarrow
+
+
+# Função para montar a tabela Arrow: metadados das combinações, Q e uma coluna de fator por carga
+def arrow_table(combination_set):
+    pa = _pyarrow()
+    arrays = columnar_arrays(combination_set)
+    columns = {
+        "Nº": pa.array(arrays["number"]),
+        "Tipo": pa.array(arrays["type_state"].tolist()).dictionary_encode(),
+        "Frequência": pa.array(arrays["frequency"].tolist()).dictionary_encode(),
+        "Critério": pa.array(arrays["criterion"].tolist()).dictionary_encode(),
+        "Q [kN/m²]": pa.array(arrays["q"]),
+    }
+    for i in range(arrays["coefficients"].shape[1]):
+        columns[f"fator_{i + 1}"] = pa.array(arrays["coefficients"][:, i])
+    loads = [
+        {"name": load["name"], "category": load["category"], "action_type": load["action_type"],
+         "value": load["value"], "direction": load["direction"]}
+        for load in combination_set.loads
+    ]
+    metadata = {"loads": json.dumps(loads, ensure_ascii=False)}
+    return pa.table(columns, metadata=metadata)
+
+
+# Função para gravar o conjunto em Arrow IPC sem compressão
+def save_arrow(combination_set, path):
+    pa = _pyarrow()
+    table = arrow_table(combination_set)
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+# Função para abrir um arquivo Arrow IPC mapeado em memória; as colunas de fatores
+# referenciam o arquivo diretamente (sem cópia)
+def open_arrow(path):
+    pa = _pyarrow()
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+# Função para gravar no formato indicado pela extensão do caminho (.npz, .arrow ou .feather)
+def save_columnar(combination_set, path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npz":
+        save_npz(combination_set, path)
+    elif extension in ARROW_EXTENSIONS:
+        save_arrow(combination_set, path)
+    else:
+        raise ValueError(f"Formato colunar não suportado: '{extension}' (use .npz, .arrow ou .feather)")
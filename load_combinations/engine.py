@@ -0,0 +1,551 @@
+import copy
+from functools import lru_cache
+from itertools import chain
+from typing import NamedTuple
+
+import numpy as np
+
+from load_combinations.factors import FREQUENCY_INDEX, factor_table
+from load_combinations.tables import ACTION_CATEGORIES
+
+
+# Função para calcular o carregamento total Q [kN/m²]
+def calculate_q(loads, combination_str):
+    q_total = 0.0
+    parts = combination_str.split()
+    for i in range(0, len(parts), 2):
+        load_idx = int(parts[i]) - 1
+        factor = float(parts[i + 1])
+        load_value = loads[load_idx]["value"]
+        direction = loads[load_idx]["direction"]
+        sign = 1 if direction == "Positiva" else -1
+        q_total += sign * load_value * factor
+    return round(q_total, 3)
+
+
+# Função para arredondar Q em 3 casas exatamente como round(q, 3) do Python, elemento a
+# elemento. np.round (q·1000 arredondado ao inteiro) só diverge quando q·1000 fica a um ulp
+# de um meio; apenas esses valores passam pelo round() do Python.
+def round_q(q):
+    q = np.asarray(q, dtype=np.float64)
+    rounded = np.round(q, 3)
+    scaled = np.abs(q * 1000)
+    near_half = np.abs(scaled % 1 - 0.5) <= 2 * np.spacing(scaled)
+    if near_half.any():
+        rounded[near_half] = [round(value, 3) for value in q[near_half].tolist()]
+    return rounded
+
+
+# Colunas da tabela de combinações exibida na interface e exportada para Excel
+COLUMNS = [
+    "Nº", "Combinação de Carga", "Tipo", "Frequência", "Critério", "Q [kN/m²]",
+    "Categorias Envolvidas", "Frequências Envolvidas"
+]
+
+
+# Função para obter o vetor de valores das cargas com o sinal da direção aplicado
+def signed_values(loads):
+    return np.array(
+        [load["value"] if load["direction"] == "Positiva" else -load["value"] for load in loads],
+        dtype=float
+    )
+
+
+# Função para montar as colunas "Categorias Envolvidas" e "Frequências Envolvidas"
+def involved_labels(loads, terms):
+    categories = ", ".join(loads[i]["category"] for i in terms)
+    frequencies = ", ".join(loads[i]["action_type"] if ACTION_CATEGORIES[loads[i]["category"]]["type"] == "variavel" else "N/A" for i in terms)
+    return categories, frequencies
+
+
+# Conjunto de combinações representado por uma matriz densa de coeficientes γ·ψ
+# (n_combinações × n_cargas). Os Q de todas as combinações são somados de uma vez, coluna
+# a coluna na ordem dos termos; a string "1 1.25 2 1.5 ..." só é montada quando a
+# interface ou o Excel a pedem.
+#
+# A estrutura (números, termos, coeficientes e rótulos) depende apenas das categorias,
+# fatores ψ e tipos selecionados; os valores e direções vêm de `loads` e podem ser
+# trocados com with_loads() sem refazer a enumeração.
+class CombinationSet:
+    def __init__(self, loads, numbers, terms, coefficients, type_states, frequencies, criteria, key=None):
+        self.loads = loads
+        self.numbers = numbers            # Nº de cada combinação
+        self.terms = terms                # índices (base 0) das cargas na ordem de exibição
+        self.coefficients = coefficients  # np.ndarray (n_combinações × n_cargas)
+        self.type_states = type_states    # "ELU" / "ELS"
+        self.frequencies = frequencies    # frequência exibida ("Normal", "Rara", ...)
+        self.criteria = criteria          # critério ("Resistência", "Conforto Visual", ...)
+        self.key = key                    # chave estrutural (ver combination_structure)
+        # Caches preguiçosos compartilhados entre cópias (e, via _build_structure, entre
+        # sessões e threads): cada um é montado à parte e publicado de uma só vez com update(),
+        # então quem o encontra não vazio o encontra completo
+        self._labels = {}                 # rótulos textuais
+        self._codes = {}                  # rótulos repetitivos codificados (ver label_codes)
+        self._term_arrays = {}            # termos em forma de matriz (ver term_arrays)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    # Função para obter o mesmo conjunto aplicado a outros valores/direções de carga
+    def with_loads(self, loads):
+        if len(loads) != self.coefficients.shape[1]:
+            raise ValueError(f"Esperadas {self.coefficients.shape[1]} cargas, recebidas {len(loads)}")
+        combination_set = copy.copy(self)
+        combination_set.loads = loads
+        return combination_set
+
+    # Função para obter o subconjunto com as linhas indicadas, preservando os Nº originais
+    def take(self, rows):
+        rows = list(rows)
+        subset = CombinationSet(
+            self.loads,
+            tuple(self.numbers[row] for row in rows),
+            tuple(self.terms[row] for row in rows),
+            self.coefficients[rows],
+            tuple(self.type_states[row] for row in rows),
+            tuple(self.frequencies[row] for row in rows),
+            tuple(self.criteria[row] for row in rows),
+            key=(self.key, tuple(rows))
+        )
+        subset.coefficients.flags.writeable = False
+        if self._labels:
+            subset._labels.update({name: [column[row] for row in rows] for name, column in self._labels.items()})
+        if self._codes:
+            subset._codes.update({name: (codes[rows], values) for name, (codes, values) in self._codes.items()})
+        return subset
+
+    # Índices das cargas e coeficientes de cada combinação na ordem dos termos, como
+    # matrizes (n_combinações × máx. de termos) completadas com coeficiente 0.0
+    def term_arrays(self):
+        if not self._term_arrays:
+            lengths = np.fromiter(map(len, self.terms), dtype=np.intp, count=len(self))
+            flat = np.fromiter(chain.from_iterable(self.terms), dtype=np.intp, count=int(lengths.sum()))
+            rows = np.repeat(np.arange(len(self)), lengths)
+            columns = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            width = int(lengths.max()) if len(self) else 0
+            index = np.zeros((len(self), width), dtype=np.intp)
+            factors = np.zeros((len(self), width))
+            index[rows, columns] = flat
+            factors[rows, columns] = self.coefficients[rows, flat]
+            self._term_arrays.update({"index": index, "factors": factors})
+        return self._term_arrays["index"], self._term_arrays["factors"]
+
+    # Carregamento total Q [kN/m²] de todas as combinações. Mesma conta de calculate_q e
+    # combination_q: soma fator·valor na ordem dos termos e arredonda como round() do Python
+    # (o np.round e o produto matriz–vetor divergem na 3ª casa em parte das linhas).
+    # Com `values` [cenários × cargas] (valores com sinal), retorna Q [cenários × combinações].
+    def q_values(self, values=None):
+        index, factors = self.term_arrays()
+        values = signed_values(self.loads) if values is None else np.asarray(values, dtype=np.float64)
+        # Cargas no primeiro eixo: cada termo copia linhas contíguas de valores
+        values = np.ascontiguousarray(values.T)
+        # Combinações em ordem decrescente de número de termos: a coluna k só soma o prefixo
+        # de combinações com mais de k termos, sem percorrer o preenchimento
+        lengths = np.count_nonzero(factors, axis=1)
+        order = np.argsort(-lengths, kind="stable")
+        index, factors = index[order], factors[order].reshape(factors.shape + (1,) * (values.ndim - 1))
+        active = np.count_nonzero(lengths[:, None] > np.arange(index.shape[1]), axis=0).tolist()
+        q = np.zeros((len(self),) + values.shape[1:])
+        for column, rows in enumerate(active):
+            q[:rows] += factors[:rows, column] * values[index[:rows, column]]
+        result = np.empty_like(q)
+        result[order] = q
+        return round_q(result.T)
+
+    # String de exibição no formato "carga fator carga fator ..."
+    def combination_str(self, row):
+        factors = self.coefficients[row]
+        return " ".join(f"{i + 1} {float(factors[i])}" for i in self.terms[row])
+
+    # Colunas textuais que não dependem dos valores das cargas, calculadas uma única vez.
+    # Rótulos iguais em linhas diferentes são o mesmo objeto str (ver label_codes).
+    def labels(self):
+        if not self._labels:
+            codes = self.label_codes()
+            # Cada par "carga fator" é formatado uma única vez e reaproveitado nas demais linhas
+            tokens = {}
+            combination_strs = []
+            for terms, row in zip(self.terms, self.coefficients):
+                factors = row.tolist()
+                parts = []
+                for i in terms:
+                    token = tokens.get((i, factors[i]))
+                    if token is None:
+                        token = tokens[(i, factors[i])] = f"{i + 1} {factors[i]}"
+                    parts.append(token)
+                combination_strs.append(" ".join(parts))
+            labels = {"Combinação de Carga": combination_strs}
+            for name in ("Categorias Envolvidas", "Frequências Envolvidas"):
+                row_codes, values = codes[name]
+                labels[name] = [values[code] for code in row_codes.tolist()]
+            self._labels.update(labels)
+        return self._labels
+
+    # Colunas com poucos valores distintos ("Tipo", "Frequência", "Critério", "Categorias
+    # Envolvidas", "Frequências Envolvidas") codificadas como (códigos int32 por linha,
+    # tupla de rótulos distintos na ordem em que aparecem)
+    def label_codes(self):
+        if not self._codes:
+            codes = {}
+            for name, column in (("Tipo", self.type_states), ("Frequência", self.frequencies), ("Critério", self.criteria)):
+                codes[name] = _intern(column)
+            # Os rótulos das cargas envolvidas só dependem da sequência (categoria, ação
+            # variável) dos termos; cada sequência distinta é montada uma única vez
+            loads = self.loads
+            load_codes = _intern((load["category"], load["action_type"]) for load in loads)[0].tolist()
+            sequences, unique_sequences = _intern(tuple(load_codes[i] for i in terms) for terms in self.terms)
+            first_terms = {}
+            for terms, code in zip(self.terms, sequences.tolist()):
+                first_terms.setdefault(code, terms)
+            involved = [involved_labels(loads, first_terms[code]) for code in range(len(unique_sequences))]
+            category_codes, category_values = _intern(labels[0] for labels in involved)
+            frequency_codes, frequency_values = _intern(labels[1] for labels in involved)
+            codes["Categorias Envolvidas"] = (category_codes[sequences], category_values)
+            codes["Frequências Envolvidas"] = (frequency_codes[sequences], frequency_values)
+            self._codes.update(codes)
+        return self._codes
+
+    # Linhas no formato da tabela (ver COLUMNS)
+    def to_rows(self):
+        labels = self.labels()
+        q_values = self.q_values().tolist()
+        return [
+            [
+                self.numbers[row], labels["Combinação de Carga"][row], self.type_states[row], self.frequencies[row],
+                self.criteria[row], q_values[row], labels["Categorias Envolvidas"][row], labels["Frequências Envolvidas"][row]
+            ]
+            for row in range(len(self))
+        ]
+
+    # Linhas no formato da tabela geradas uma a uma, sem montar a lista completa nem
+    # guardar as strings de combinação (para gravação em fluxo, ex.: export.write_xlsx)
+    def iter_rows(self):
+        category_codes, category_values = self.label_codes()["Categorias Envolvidas"]
+        frequency_codes, frequency_values = self.label_codes()["Frequências Envolvidas"]
+        q_values = self.q_values().tolist()
+        for row, (category, frequency) in enumerate(zip(category_codes.tolist(), frequency_codes.tolist())):
+            yield [
+                self.numbers[row], self.combination_str(row), self.type_states[row], self.frequencies[row],
+                self.criteria[row], q_values[row], category_values[category], frequency_values[frequency]
+            ]
+
+
+# Função para internar uma sequência de valores: retorna (códigos int32 por posição,
+# tupla dos valores distintos na ordem da primeira ocorrência)
+def _intern(values):
+    index = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return np.array(codes, dtype=np.int32), tuple(index)
+
+
+# Combinação individual produzida pelo gerador. `terms` são os índices (base 0) das cargas
+# na ordem de exibição e `factors` os coeficientes γ·ψ correspondentes.
+class Combination(NamedTuple):
+    number: int
+    terms: tuple
+    factors: tuple
+    type_state: str
+    frequency: str
+    criterion: str
+
+
+# Índices (base 0) das cargas separados pelos grupos usados nas regras de combinação
+class LoadGroups(NamedTuple):
+    permanent: list
+    exceptional: list
+    wind: list
+    non_wind: list
+
+
+# Função para separar as cargas por tipo e isolar as cargas de vento
+def group_loads(loads):
+    permanent, exceptional, wind, non_wind = [], [], [], []
+    for i, load in enumerate(loads):
+        action_info = ACTION_CATEGORIES[load["category"]]
+        if action_info["type"] == "permanente":
+            permanent.append(i)
+        elif action_info["type"] == "excepcional":
+            exceptional.append(i)
+        if action_info["is_wind"]:
+            wind.append(i)
+        elif action_info["type"] == "variavel":
+            non_wind.append(i)
+    return LoadGroups(permanent, exceptional, wind, non_wind)
+
+
+# Cada família abaixo gera, na ordem de numeração, pares (fixas, variáveis):
+#   fixas      -> cargas sempre incluídas com o fator secundário (permanentes, excepcional);
+#   variáveis  -> cargas variáveis, a primeira é a principal; fatores nulos são omitidos.
+# Todo par consome um número, mesmo que resulte em uma combinação vazia.
+
+# Combinações apenas com cargas permanentes
+def _permanent_only(groups):
+    if groups.permanent:
+        yield groups.permanent, []
+
+
+def _permanent_only_size(groups):
+    return 1 if groups.permanent else 0
+
+
+# ELU Normal, Frequente e Rara: cada variável não-vento como principal e, depois,
+# uma carga de vento por vez combinada com as demais variáveis
+def _variable_with_wind(groups):
+    non_wind = groups.non_wind
+    for main in non_wind:
+        yield groups.permanent, [main] + [i for i in non_wind if i != main]
+    for wind in groups.wind:
+        # Se não houver outras cargas variáveis, vento é predominante
+        if not non_wind:
+            yield groups.permanent, [wind]
+            continue
+        for main in non_wind + [wind]:
+            variables = [main] + [i for i in non_wind if i != main]
+            # Se a carga principal não for vento, adicionar a carga de vento atual
+            if main != wind:
+                variables.append(wind)
+            yield groups.permanent, variables
+
+
+def _variable_with_wind_size(groups):
+    n_non_wind = len(groups.non_wind)
+    return n_non_wind + len(groups.wind) * (n_non_wind + 1 if n_non_wind else 1)
+
+
+# ELU Acidental: uma carga excepcional por vez sobre as permanentes
+def _accidental(groups):
+    for exceptional in groups.exceptional:
+        yield groups.permanent + [exceptional], []
+
+
+def _accidental_size(groups):
+    return len(groups.exceptional)
+
+
+# ELS Quase Permanente: vento não entra, pois ψ₂ = 0.0 para Q_V
+def _quasi_permanent(groups):
+    for main in groups.non_wind:
+        yield groups.permanent, [main]
+
+
+def _quasi_permanent_size(groups):
+    return len(groups.non_wind)
+
+
+# ELS Frequente: uma carga variável por vez, inclusive vento
+def _single_variable(groups):
+    for main in groups.non_wind + groups.wind:
+        yield groups.permanent, [main]
+
+
+def _single_variable_size(groups):
+    return len(groups.non_wind) + len(groups.wind)
+
+
+# ELS Rara: cada variável como principal; o vento principal não acompanha outros ventos
+def _rare_service(groups):
+    for main in groups.non_wind:
+        yield groups.permanent, [main] + [i for i in groups.non_wind + groups.wind if i != main]
+    for wind in groups.wind:
+        yield groups.permanent, [wind] + groups.non_wind
+
+
+def _rare_service_size(groups):
+    return len(groups.non_wind) + len(groups.wind)
+
+
+# Família de combinações: tipo selecionável, frequência usada nos fatores, rótulos da tabela,
+# gerador de pares, quantidade de números que a família consome (sem enumerá-la) e nome
+# de exibição (único entre as famílias; ex.: contagens do painel de diagnóstico)
+class Family(NamedTuple):
+    selected_type: str
+    frequency: str
+    type_state: str
+    criterion: str
+    slots: object
+    size: object
+    label: str
+
+    # Frequência exibida na tabela ("ELS Frequente - Danos Reversíveis" -> "Frequente")
+    @property
+    def frequency_display(self):
+        return self.frequency.replace("ELS ", "").split(" - ")[0]
+
+
+# Famílias na ordem em que são numeradas
+FAMILIES = [
+    Family("ELU Normal", "Normal", "ELU", "Resistência", _permanent_only, _permanent_only_size, "ELU Normal (permanentes)"),
+    Family("ELS Normal", "ELS Normal", "ELS", "Conforto Visual", _permanent_only, _permanent_only_size, "ELS Normal (permanentes)"),
+    Family("ELU Normal", "Normal", "ELU", "Resistência", _variable_with_wind, _variable_with_wind_size, "ELU Normal (variáveis e vento)"),
+    Family("ELU Frequente", "Frequente", "ELU", "Resistência", _variable_with_wind, _variable_with_wind_size, "ELU Frequente (variáveis e vento)"),
+    Family("ELU Rara", "Rara", "ELU", "Resistência", _variable_with_wind, _variable_with_wind_size, "ELU Rara (variáveis e vento)"),
+    Family("ELU Acidental", "Acidental", "ELU", "Resistência", _accidental, _accidental_size, "ELU Acidental (excepcionais)"),
+    Family("ELS Quase Permanente", "ELS Quase Permanente", "ELS", "Conforto Visual", _quasi_permanent, _quasi_permanent_size, "ELS Quase Permanente (variáveis sem vento)"),
+    Family("ELS Frequente - Danos Reversíveis", "ELS Frequente - Danos Reversíveis", "ELS", "Danos Reversíveis", _single_variable, _single_variable_size, "ELS Frequente - Danos Reversíveis (uma variável)"),
+    Family("ELS Frequente - Danos Irreversíveis", "ELS Frequente - Danos Irreversíveis", "ELS", "Danos Irreversíveis", _single_variable, _single_variable_size, "ELS Frequente - Danos Irreversíveis (uma variável)"),
+    Family("ELS Rara", "ELS Rara", "ELS", "Danos Irreversíveis", _rare_service, _rare_service_size, "ELS Rara (variáveis e vento)"),
+]
+
+
+# Função para listar as famílias selecionadas com o primeiro número de cada uma,
+# calculado pelos tamanhos das famílias anteriores (sem enumerar as combinações)
+def family_offsets(groups, selected_types):
+    offsets = []
+    number = 1
+    for family in FAMILIES:
+        if family.selected_type not in selected_types:
+            continue
+        offsets.append((family, number))
+        number += family.size(groups)
+    return offsets
+
+
+# Função para montar uma combinação a partir de um par (fixas, variáveis) de uma família.
+# Retorna None quando todos os fatores das variáveis são nulos e não há cargas fixas.
+def make_combination(number, fixed, variables, lookup, family):
+    freq_idx = FREQUENCY_INDEX[family.frequency]
+    terms = []
+    factors = []
+    for i in fixed:
+        terms.append(i)
+        factors.append(lookup[i][freq_idx][0])
+    for position, i in enumerate(variables):
+        factor = lookup[i][freq_idx][position == 0]
+        if factor > 0:
+            terms.append(i)
+            factors.append(factor)
+    if not terms:
+        return None
+    return Combination(number, tuple(terms), tuple(factors), family.type_state, family.frequency_display, family.criterion)
+
+
+# Função para gerar as combinações uma a uma, sem materializar a lista completa.
+# A numeração é estável: depende apenas das cargas e dos tipos selecionados.
+def iter_combinations(loads, selected_types):
+    # Tabela de fatores γ·ψ pré-calculada para esta definição de cargas
+    lookup = factor_table(loads).tolist()
+    groups = group_loads(loads)
+
+    for family, number in family_offsets(groups, selected_types):
+        for fixed, variables in family.slots(groups):
+            combination = make_combination(number, fixed, variables, lookup, family)
+            if combination is not None:
+                yield combination
+            number += 1
+
+
+# Função para calcular Q [kN/m²] de uma única combinação a partir dos valores com sinal
+def combination_q(combination, values):
+    return round(sum(factor * values[i] for i, factor in zip(combination.terms, combination.factors)), 3)
+
+
+# Função para montar a string de exibição de uma única combinação
+def format_combination(combination):
+    return " ".join(f"{i + 1} {factor}" for i, factor in zip(combination.terms, combination.factors))
+
+
+# Função para gerar as linhas da tabela (ver COLUMNS) uma a uma, sem materializar o conjunto
+def iter_rows(loads, selected_types):
+    values = signed_values(loads).tolist()
+    for combination in iter_combinations(loads, selected_types):
+        categories, frequencies = involved_labels(loads, combination.terms)
+        yield [
+            combination.number, format_combination(combination), combination.type_state, combination.frequency,
+            combination.criterion, combination_q(combination, values), categories, frequencies
+        ]
+
+
+# Função para obter a chave estrutural das cargas: tudo o que define quais combinações
+# existem e seus fatores/rótulos, sem valores, direções ou nomes
+def structure_key(loads):
+    return tuple(
+        (load["category"], load["action_type"], load["factors"]["ψ₀"], load["factors"]["ψ₁"], load["factors"]["ψ₂"])
+        for load in loads
+    )
+
+
+# Função para reconstruir cargas mínimas (sem valores) a partir da chave estrutural
+def structure_loads(key):
+    return [
+        {
+            "name": "",
+            "type": ACTION_CATEGORIES[category]["type"],
+            "category": category,
+            "value": 0.0,
+            "factors": {"ψ₀": psi_0, "ψ₁": psi_1, "ψ₂": psi_2},
+            "action_type": action_type,
+            "direction": "Positiva",
+        }
+        for category, action_type, psi_0, psi_1, psi_2 in key
+    ]
+
+
+# Função para reunir combinações (ex.: de iter_combinations) em um CombinationSet
+def assemble_combination_set(loads, combinations, key=None):
+    numbers = []
+    terms = []
+    type_states = []
+    frequencies = []
+    criteria = []
+    rows = []
+    columns = []
+    values = []
+
+    for row, combination in enumerate(combinations):
+        numbers.append(combination.number)
+        terms.append(combination.terms)
+        type_states.append(combination.type_state)
+        frequencies.append(combination.frequency)
+        criteria.append(combination.criterion)
+        rows.extend([row] * len(combination.terms))
+        columns.extend(combination.terms)
+        values.extend(combination.factors)
+
+    # Matriz densa de coeficientes (n_combinações × n_cargas)
+    coefficients = np.zeros((len(numbers), len(loads)))
+    coefficients[rows, columns] = values
+    coefficients.flags.writeable = False
+
+    return CombinationSet(
+        loads, tuple(numbers), tuple(terms), coefficients, tuple(type_states), tuple(frequencies), tuple(criteria),
+        key=key
+    )
+
+
+# Função para concatenar conjuntos parciais (na ordem de numeração) em um único conjunto
+def concat_combination_sets(loads, parts, key=None):
+    coefficients = np.vstack([part.coefficients for part in parts]) if parts else np.zeros((0, len(loads)))
+    coefficients.flags.writeable = False
+    return CombinationSet(
+        loads,
+        tuple(number for part in parts for number in part.numbers),
+        tuple(terms for part in parts for terms in part.terms),
+        coefficients,
+        tuple(value for part in parts for value in part.type_states),
+        tuple(value for part in parts for value in part.frequencies),
+        tuple(value for part in parts for value in part.criteria),
+        key=key
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_structure(key, selected_types):
+    loads = structure_loads(key)
+    return assemble_combination_set(loads, iter_combinations(loads, selected_types), key=(key, selected_types))
+
+
+# Função para obter a estrutura de combinações (sem valores de carga), reaproveitada
+# enquanto categorias, fatores ψ e tipos selecionados não mudarem
+def combination_structure(loads, selected_types):
+    return _build_structure(structure_key(loads), frozenset(selected_types))
+
+
+# Função para montar o conjunto de combinações com base nos tipos selecionados.
+# Quando só valores ou direções mudam, apenas Q é recalculado.
+def build_combination_set(loads, selected_types):
+    return combination_structure(loads, selected_types).with_loads(loads)
+
+
+# Função para gerar combinações de carga com base nos tipos selecionados
+def generate_combinations(loads, selected_types):
+    return build_combination_set(loads, selected_types).to_rows()
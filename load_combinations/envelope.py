@@ -0,0 +1,91 @@
+import os
+
+import numpy as np
+
+# Envoltória de esforços internos por barra sobre as combinações.
+#
+# Entrada: array (barras × casos de carga × componentes) com os esforços (N, V, M, ...)
+# de cada caso de carga básico, um caso por carga do projeto, na mesma ordem. Os
+# resultados de cada caso já incluem a magnitude e o sentido da carga analisada, então
+# apenas os coeficientes γ·ψ da matriz de combinações são aplicados.
+#
+# A entrada é lida em blocos de barras (podendo ser um np.memmap maior que a RAM) e as
+# saídas podem ser gravadas diretamente em arquivos .npy mapeados em memória.
+
+ENVELOPE_OUTPUTS = ["max", "min", "max_combination", "min_combination"]
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+
+# Função para escolher quantas barras processar por bloco dentro do orçamento de memória.
+# Por barra, o bloco guarda a entrada (casos × componentes) e os valores combinados
+# (componentes × combinações), além do índice do argmax/argmin.
+def chunk_size_for(n_load_cases, n_components, n_combinations, memory_budget=DEFAULT_MEMORY_BUDGET):
+    per_member = 8 * n_components * (n_load_cases + 2 * n_combinations)
+    return max(1, memory_budget // max(per_member, 1))
+
+
+# Função para abrir um arquivo de resultados .npy mapeado em memória
+def open_results(path):
+    results = np.load(path, mmap_mode="r")
+    if results.ndim != 3:
+        raise ValueError(f"{path}: esperado array (barras × casos de carga × componentes), recebido {results.shape}")
+    return results
+
+
+# Função para alocar as saídas da envoltória, em memória ou como .npy em `output_dir`
+def allocate_outputs(n_members, n_components, output_dir=None):
+    shape = (n_members, n_components)
+    dtypes = {"max": np.float64, "min": np.float64, "max_combination": np.int64, "min_combination": np.int64}
+    if output_dir is None:
+        return {name: np.empty(shape, dtype=dtypes[name]) for name in ENVELOPE_OUTPUTS}
+    os.makedirs(output_dir, exist_ok=True)
+    return {
+        name: np.lib.format.open_memmap(os.path.join(output_dir, f"{name}.npy"), mode="w+", dtype=dtypes[name], shape=shape)
+        for name in ENVELOPE_OUTPUTS
+    }
+
+
+# Função para calcular as envoltórias máxima e mínima de cada barra e componente,
+# com o número (Nº) da combinação que governa cada valor.
+#   results       -> array (barras × casos de carga × componentes), aceita np.memmap
+#   coefficients  -> matriz (combinações × casos de carga) de CombinationSet.coefficients
+#   numbers       -> Nº de cada linha de `coefficients`
+#   progress      -> chamada opcional progress(barras_processadas, total_de_barras)
+def compute_envelope(results, coefficients, numbers, output_dir=None, chunk_members=None,
+                     memory_budget=DEFAULT_MEMORY_BUDGET, progress=None):
+    n_members, n_load_cases, n_components = results.shape
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    numbers = np.asarray(numbers, dtype=np.int64)
+    if coefficients.shape[1] != n_load_cases:
+        raise ValueError(
+            f"O arquivo de resultados tem {n_load_cases} casos de carga, mas o projeto tem {coefficients.shape[1]} cargas"
+        )
+    if not len(numbers):
+        raise ValueError("Nenhuma combinação para aplicar aos resultados")
+
+    outputs = allocate_outputs(n_members, n_components, output_dir)
+    if chunk_members is None:
+        chunk_members = chunk_size_for(n_load_cases, n_components, len(numbers), memory_budget)
+
+    # Coeficientes transpostos: (casos de carga × combinações)
+    combination_matrix = np.ascontiguousarray(coefficients.T)
+    for start in range(0, n_members, chunk_members):
+        stop = min(start + chunk_members, n_members)
+        block = np.asarray(results[start:stop], dtype=np.float64)
+        # (barras × componentes × casos) @ (casos × combinações) -> (barras × componentes × combinações)
+        combined = np.matmul(block.transpose(0, 2, 1), combination_matrix)
+
+        max_idx = combined.argmax(axis=2)
+        min_idx = combined.argmin(axis=2)
+        outputs["max"][start:stop] = np.take_along_axis(combined, max_idx[..., None], axis=2)[..., 0]
+        outputs["min"][start:stop] = np.take_along_axis(combined, min_idx[..., None], axis=2)[..., 0]
+        outputs["max_combination"][start:stop] = numbers[max_idx]
+        outputs["min_combination"][start:stop] = numbers[min_idx]
+        if progress is not None:
+            progress(stop, n_members)
+
+    if output_dir is not None:
+        for array in outputs.values():
+            array.flush()
+    return outputs
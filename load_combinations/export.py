@@ -0,0 +1,77 @@
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+from load_combinations.engine import COLUMNS
+
+SHEET_NAME = "Combinações"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Colunas da tabela com poucos valores distintos, montadas com dtype category
+CATEGORICAL_COLUMNS = ["Tipo", "Frequência", "Critério", "Categorias Envolvidas", "Frequências Envolvidas"]
+
+# Estilo do cabeçalho igual ao gerado por DataFrame.to_excel
+_THIN = Side(style="thin")
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+
+# Função para montar o DataFrame das combinações direto das colunas do conjunto, sem passar
+# por listas de linhas. As colunas repetitivas viram pd.Categorical sobre os códigos
+# internados de CombinationSet.label_codes; `q_values` substitui o cálculo de Q.
+def combinations_dataframe(combination_set, q_values=None):
+    codes = combination_set.label_codes()
+    data = {
+        "Nº": np.asarray(combination_set.numbers, dtype=np.int64),
+        "Combinação de Carga": combination_set.labels()["Combinação de Carga"],
+        "Q [kN/m²]": combination_set.q_values() if q_values is None else q_values,
+    }
+    for name in CATEGORICAL_COLUMNS:
+        row_codes, values = codes[name]
+        data[name] = pd.Categorical.from_codes(row_codes, categories=list(values))
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+# Função para codificar a tabela de combinações como arquivo .xlsx em memória
+def xlsx_bytes(df):
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False, sheet_name=SHEET_NAME)
+    return output.getvalue()
+
+
+# Função para gravar linhas da tabela em .xlsx de forma incremental. Usa o modo write-only
+# do openpyxl: cada linha é serializada ao ser adicionada, sem manter a árvore de células
+# em memória, então `rows` pode ser um gerador (ex.: engine.iter_rows).
+def write_xlsx(rows, fileobj, columns=COLUMNS):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(SHEET_NAME)
+
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(sheet, value=column)
+        cell.font = _HEADER_FONT
+        cell.border = _HEADER_BORDER
+        cell.alignment = _HEADER_ALIGNMENT
+        header.append(cell)
+    sheet.append(header)
+
+    count = 0
+    for row in rows:
+        sheet.append(row)
+        count += 1
+
+    workbook.save(fileobj)
+    return count
+
+
+# Função para codificar linhas em .xlsx no modo incremental e devolver os bytes
+def xlsx_stream_bytes(rows, columns=COLUMNS):
+    output = io.BytesIO()
+    write_xlsx(rows, output, columns)
+    return output.getvalue()
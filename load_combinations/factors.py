@@ -0,0 +1,100 @@
+from functools import lru_cache
+
+import numpy as np
+
+from load_combinations.tables import ACTION_CATEGORIES
+
+# Frequências (estados limites) reconhecidas por get_factors, na ordem dos índices da tabela
+FREQUENCIES = [
+    "Normal",
+    "Frequente",
+    "Rara",
+    "Acidental",
+    "ELS Normal",
+    "ELS Quase Permanente",
+    "ELS Frequente - Danos Reversíveis",
+    "ELS Frequente - Danos Irreversíveis",
+    "ELS Rara",
+]
+FREQUENCY_INDEX = {frequency: i for i, frequency in enumerate(FREQUENCIES)}
+
+
+# Função para determinar os fatores de ponderação com base na categoria e frequência
+def get_factors(load, frequency, is_main=False):
+    load_type = load["type"]
+    category = load["category"]
+    action_info = ACTION_CATEGORIES[category]
+
+    if action_info["type"] == "permanente":
+        if frequency in ["Normal", "Frequente", "Rara"]:
+            return action_info["gamma"]["Normal"]
+        elif frequency == "Acidental":
+            return action_info["gamma"]["Excepcional"]
+        return 1.0
+    elif action_info["type"] == "variavel":
+        psi_0 = load["factors"]["ψ₀"]
+        psi_1 = load["factors"]["ψ₁"]
+        psi_2 = load["factors"]["ψ₂"]
+        gamma_q = action_info["gamma"]["Normal"]
+        if frequency in ["Frequente", "Rara"]:
+            gamma_q = action_info["gamma"]["Especial"]
+        elif frequency in ["ELS Normal", "ELS Frequente - Danos Reversíveis", "ELS Frequente - Danos Irreversíveis", "ELS Quase Permanente", "ELS Rara"]:
+            gamma_q = 1.0
+        
+        if frequency == "Normal":
+            return gamma_q if is_main else (gamma_q * psi_0)
+        elif frequency == "Frequente":
+            return (gamma_q * psi_1) if is_main else (gamma_q * psi_0)
+        elif frequency == "Rara":
+            # Para vento (Q_V), usar apenas ψ₀, independentemente de ser predominante ou não
+            if action_info["is_wind"]:
+                return psi_0
+            return gamma_q if is_main else (gamma_q * psi_0)
+        elif frequency == "ELS Normal":
+            return 1.0
+        elif frequency == "ELS Frequente - Danos Reversíveis":
+            return psi_1 if is_main else psi_2
+        elif frequency == "ELS Frequente - Danos Irreversíveis":
+            return psi_1 if is_main else psi_2
+        elif frequency == "ELS Quase Permanente":
+            return psi_2
+        elif frequency == "ELS Rara":
+            return 1.0 if is_main else psi_1
+    elif action_info["type"] == "excepcional":
+        if frequency == "Acidental":
+            return 1.0  # Ajustado conforme referência
+        return 1.0  # Ajustado para ELU Rara conforme referência
+    return 1.0
+
+
+# Função para obter a chave estrutural dos fatores de uma lista de cargas.
+# Só a categoria e os fatores ψ influenciam γ·ψ; valor, direção e nome ficam de fora,
+# de modo que alterar apenas magnitudes não invalida a tabela.
+def factor_key(loads):
+    return tuple(
+        (load["category"], load["factors"]["ψ₀"], load["factors"]["ψ₁"], load["factors"]["ψ₂"])
+        for load in loads
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_factor_table(key):
+    table = np.empty((len(key), len(FREQUENCIES), 2))
+    for i, (category, psi_0, psi_1, psi_2) in enumerate(key):
+        load = {
+            "type": ACTION_CATEGORIES[category]["type"],
+            "category": category,
+            "factors": {"ψ₀": psi_0, "ψ₁": psi_1, "ψ₂": psi_2},
+        }
+        for j, frequency in enumerate(FREQUENCIES):
+            table[i, j, 0] = get_factors(load, frequency, is_main=False)
+            table[i, j, 1] = get_factors(load, frequency, is_main=True)
+    table.flags.writeable = False
+    return table
+
+
+# Função para obter a tabela pré-calculada de fatores γ·ψ, indexada por
+# [carga, FREQUENCY_INDEX[frequência], is_main]. A tabela é construída uma única vez
+# por definição estrutural das cargas (ver factor_key) e reaproveitada entre chamadas.
+def factor_table(loads):
+    return _build_factor_table(factor_key(loads))
@@ -0,0 +1,201 @@
+from typing import NamedTuple
+
+from load_combinations.engine import (
+    _accidental,
+    _permanent_only,
+    _quasi_permanent,
+    _rare_service,
+    _single_variable,
+    _variable_with_wind,
+    combination_q,
+    family_offsets,
+    group_loads,
+    make_combination,
+    signed_values,
+)
+from load_combinations.factors import FREQUENCY_INDEX, factor_table
+
+# Busca direta da combinação governante (Q máximo e mínimo) por estado limite e critério,
+# sem enumerar as combinações. Em cada família, Q de uma combinação é
+#   Q = Σ fixas + Σ secundárias + (fator principal − fator secundário)·valor da principal
+# e as somas são separáveis, então o melhor par (principal, vento) sai de argmax/argmin
+# independentes sobre as cargas: O(n) por família em vez de O(n_vento × n_variáveis × n).
+#
+# Nas famílias com várias variáveis (ELU Normal/Frequente/Rara e ELS Rara) assume-se que o
+# fator da carga principal é positivo, o que vale para todos os ψ da Tabela 2 da NBR 8800;
+# nas famílias de uma variável, combinações vazias (ψ nulo sem permanentes) são descartadas
+# como na enumeração.
+#
+# Q é arredondado em 3 casas, então combinações com Q calculado um pouco abaixo do melhor
+# podem empatar com ele depois do arredondamento. Por isso cada escolha devolve todas as
+# cargas a menos de NEAR_BEST da melhor, e find_governing decide pelo Q arredondado de cada
+# candidata e, em empate, pelo menor Nº (o mesmo resultado da enumeração completa).
+
+SENSES = {"max": 1, "min": -1}
+NEAR_BEST = 1e-3 + 1e-6  # diferença máxima antes do arredondamento entre Q empatados, com folga
+
+
+# Combinação governante de um grupo (Tipo, Critério) para o sentido "max" ou "min"
+class GoverningCombination(NamedTuple):
+    type_state: str
+    criterion: str
+    sense: str
+    q: float
+    combination: object
+
+
+# Função para obter, em ordem crescente, os índices dos valores a menos de NEAR_BEST do
+# melhor no sentido pedido, ignorando None
+def _near_best(values, sense):
+    present = [sense * value for value in values if value is not None]
+    if not present:
+        return []
+    limit = max(present) - NEAR_BEST
+    return [k for k, value in enumerate(values) if value is not None and sense * value >= limit]
+
+
+def _others(indices, k):
+    return indices[:k] + indices[k + 1:]
+
+
+# Cada solver devolve candidatos (valor, número, fixas, variáveis), em geral O(1) e mais
+# só quando há cargas quase empatadas, entre os quais estão todas as combinações da família
+# que podem empatar com a melhor depois do arredondamento
+
+def _solve_permanent_only(groups, main, secondary, offset, sense):
+    if not groups.permanent:
+        return []
+    return [(sum(secondary[i] for i in groups.permanent), offset, groups.permanent, [])]
+
+
+def _solve_variable_with_wind(groups, main, secondary, offset, sense):
+    permanent, non_wind, wind = groups.permanent, groups.non_wind, groups.wind
+    fixed_sum = sum(secondary[i] for i in permanent)
+    secondary_sum = sum(secondary[i] for i in non_wind)
+    delta = [main[i] - secondary[i] for i in non_wind]
+    n_non_wind = len(non_wind)
+    candidates = []
+
+    best_mains = _near_best(delta, sense)
+    for k in best_mains:
+        variables = [non_wind[k]] + _others(non_wind, k)
+        candidates.append((fixed_sum + secondary_sum + delta[k], offset + k, permanent, variables))
+
+    base = offset + n_non_wind
+    if wind and not non_wind:
+        for k in _near_best([main[w] for w in wind], sense):
+            candidates.append((fixed_sum + main[wind[k]], base + k, permanent, [wind[k]]))
+    elif wind:
+        # Variável não-vento principal acompanhada de um vento secundário
+        for kw in _near_best([secondary[w] for w in wind], sense):
+            for k in best_mains:
+                variables = [non_wind[k]] + _others(non_wind, k) + [wind[kw]]
+                value = fixed_sum + secondary_sum + delta[k] + secondary[wind[kw]]
+                candidates.append((value, base + kw * (n_non_wind + 1) + k, permanent, variables))
+        # Vento principal
+        for kw in _near_best([main[w] for w in wind], sense):
+            value = fixed_sum + secondary_sum + main[wind[kw]]
+            candidates.append((value, base + kw * (n_non_wind + 1) + n_non_wind, permanent, [wind[kw]] + non_wind))
+    return candidates
+
+
+def _solve_accidental(groups, main, secondary, offset, sense):
+    if not groups.exceptional:
+        return []
+    fixed_sum = sum(secondary[i] for i in groups.permanent)
+    return [
+        (fixed_sum + secondary[groups.exceptional[k]], offset + k, groups.permanent + [groups.exceptional[k]], [])
+        for k in _near_best([secondary[e] for e in groups.exceptional], sense)
+    ]
+
+
+def _solve_single(candidates_for, groups, main, secondary, offset, sense, main_factors):
+    loads = candidates_for(groups)
+    fixed_sum = sum(secondary[i] for i in groups.permanent)
+    # Sem permanentes, uma principal com fator nulo gera combinação vazia (descartada)
+    values = [main[i] if groups.permanent or main_factors[i] > 0 else None for i in loads]
+    return [(fixed_sum + main[loads[k]], offset + k, groups.permanent, [loads[k]]) for k in _near_best(values, sense)]
+
+
+def _solve_quasi_permanent(groups, main, secondary, offset, sense, main_factors):
+    return _solve_single(lambda g: g.non_wind, groups, main, secondary, offset, sense, main_factors)
+
+
+def _solve_single_variable(groups, main, secondary, offset, sense, main_factors):
+    return _solve_single(lambda g: g.non_wind + g.wind, groups, main, secondary, offset, sense, main_factors)
+
+
+def _solve_rare_service(groups, main, secondary, offset, sense):
+    permanent, non_wind, wind = groups.permanent, groups.non_wind, groups.wind
+    fixed_sum = sum(secondary[i] for i in permanent)
+    non_wind_sum = sum(secondary[i] for i in non_wind)
+    wind_sum = sum(secondary[i] for i in wind)
+    candidates = []
+
+    for k in _near_best([main[i] - secondary[i] for i in non_wind], sense):
+        variables = [non_wind[k]] + [i for i in non_wind + wind if i != non_wind[k]]
+        value = fixed_sum + non_wind_sum + wind_sum + main[non_wind[k]] - secondary[non_wind[k]]
+        candidates.append((value, offset + k, permanent, variables))
+    for k in _near_best([main[w] for w in wind], sense):
+        candidates.append((fixed_sum + non_wind_sum + main[wind[k]], offset + len(non_wind) + k, permanent, [wind[k]] + non_wind))
+    return candidates
+
+
+# Solver de cada gerador de família; os de uma variável recebem também os fatores principais
+_SOLVERS = {
+    _permanent_only: _solve_permanent_only,
+    _variable_with_wind: _solve_variable_with_wind,
+    _accidental: _solve_accidental,
+    _quasi_permanent: _solve_quasi_permanent,
+    _single_variable: _solve_single_variable,
+    _rare_service: _solve_rare_service,
+}
+_NEEDS_MAIN_FACTORS = {_quasi_permanent, _single_variable}
+
+
+# Função para encontrar as combinações governantes (Q máx. e mín.) de cada grupo
+# (Tipo, Critério) sem gerar a tabela completa. Em empates vale o menor Nº.
+def find_governing(loads, selected_types):
+    lookup = factor_table(loads).tolist()
+    values = signed_values(loads).tolist()
+    groups = group_loads(loads)
+
+    best = {}
+    for family, offset in family_offsets(groups, selected_types):
+        freq_idx = FREQUENCY_INDEX[family.frequency]
+        main_factors = [lookup[i][freq_idx][1] for i in range(len(loads))]
+        main = [factor * value for factor, value in zip(main_factors, values)]
+        secondary = [lookup[i][freq_idx][0] * values[i] for i in range(len(loads))]
+        solver = _SOLVERS[family.slots]
+
+        for sense_name, sense in SENSES.items():
+            if family.slots in _NEEDS_MAIN_FACTORS:
+                candidates = solver(groups, main, secondary, offset, sense, main_factors)
+            else:
+                candidates = solver(groups, main, secondary, offset, sense)
+            for _, number, fixed, variables in candidates:
+                combination = make_combination(number, fixed, variables, lookup, family)
+                if combination is None:
+                    continue
+                q = combination_q(combination, values)
+                key = (family.type_state, family.criterion, sense_name)
+                current = best.get(key)
+                if current is None or sense * q > sense * current.q or (q == current.q and number < current.combination.number):
+                    best[key] = GoverningCombination(family.type_state, family.criterion, sense_name, q, combination)
+    return list(best.values())
+
+
+# Função de referência: mesma resposta obtida por enumeração completa (para verificação)
+def brute_force_governing(loads, selected_types):
+    from load_combinations.engine import iter_combinations
+
+    values = signed_values(loads).tolist()
+    best = {}
+    for combination in iter_combinations(loads, selected_types):
+        q = combination_q(combination, values)
+        for sense_name, sense in SENSES.items():
+            key = (combination.type_state, combination.criterion, sense_name)
+            current = best.get(key)
+            if current is None or sense * q > sense * current.q:
+                best[key] = GoverningCombination(combination.type_state, combination.criterion, sense_name, q, combination)
+    return list(best.values())
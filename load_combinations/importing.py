@@ -0,0 +1,130 @@
+import os
+import zipfile
+
+import numpy as np
+
+from load_combinations.project import DIRECTIONS, ProjectError
+from load_combinations.tables import ACTION_CATEGORIES, ACTION_FACTORS
+
+# Importação em lote de carregamentos a partir de uma tabela (.csv ou .xlsx), validada
+# coluna a coluna em uma única passagem, em vez de um conjunto de widgets por carga.
+# pandas só é importado na primeira leitura, para não pesar na partida da interface.
+#
+# Colunas (nomes em inglês, iguais aos campos das cargas, ou os equivalentes em português):
+#   name / nome                 -> opcional; padrão "Carregamento N"
+#   category / categoria        -> código da Tabela 1 (ex.: "G_Me") ou o rótulo da interface
+#   value / valor               -> kN/m², finito e não negativo
+#   direction / direção         -> opcional; "Positiva" (padrão) ou "Negativa"
+#   action_type / ação_variável -> obrigatório para ações variáveis (Tabela 2)
+
+COLUMN_ALIASES = {
+    "name": "name", "nome": "name",
+    "category": "category", "categoria": "category",
+    "value": "value", "valor": "value",
+    "direction": "direction", "direção": "direction", "direcao": "direction",
+    "action_type": "action_type", "ação_variável": "action_type", "acao_variavel": "action_type",
+}
+REQUIRED_COLUMNS = ["category", "value"]
+TABLE_EXTENSIONS = (".csv", ".xlsx")
+
+TEMPLATE_CSV = (
+    "name,category,value,direction,action_type\n"
+    "Peso próprio,G_Me,0.5,Positiva,\n"
+    'Sobrecarga,Q_G,1.0,Positiva,"Bibliotecas, arquivos, depósitos, oficinas, garagens e coberturas"\n'
+    "Vento 0°,Q_V,0.8,Negativa,Pressão dinâmica do vento nas estruturas em geral\n"
+)
+
+
+# Erro de validação de uma tabela de cargas, com todas as mensagens encontradas
+class LoadTableError(ProjectError):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} erro(s) na tabela de carregamentos:\n" + "\n".join(errors))
+
+
+# Função para ler a tabela de cargas; `file` pode ser um caminho ou um arquivo aberto
+# (ex.: o retorno de st.file_uploader), com o formato indicado pela extensão de `filename`
+def read_load_table(file, filename=None):
+    import pandas as pd
+
+    filename = filename or getattr(file, "name", None) or str(file)
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in TABLE_EXTENSIONS:
+        raise ProjectError(f"Formato de tabela não suportado: '{extension}' (use .csv ou .xlsx)")
+    try:
+        if extension == ".csv":
+            return pd.read_csv(file, sep=None, engine="python", dtype=str, keep_default_na=False, encoding="utf-8-sig")
+        return pd.read_excel(file, dtype=str, keep_default_na=False)
+    except (ValueError, KeyError, zipfile.BadZipFile, pd.errors.ParserError) as exc:
+        raise ProjectError(f"{os.path.basename(filename)}: tabela ilegível ({exc})") from None
+
+
+# Função para validar a tabela inteira e convertê-la em cargas no formato da interface.
+# Todos os erros são reunidos e levantados juntos em LoadTableError.
+def validate_load_table(df):
+    import pandas as pd
+
+    df = df.rename(columns=lambda column: COLUMN_ALIASES.get(str(column).strip().lower(), str(column).strip()))
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        raise LoadTableError([f"Coluna obrigatória ausente: {', '.join(missing)}"])
+    df = df.loc[~(df.astype(str).apply(lambda column: column.str.strip()) == "").all(axis=1)].reset_index(drop=True)
+    if df.empty:
+        raise LoadTableError(["A tabela não contém carregamentos"])
+
+    n = len(df)
+    line = pd.Series(range(2, n + 2))  # número da linha no arquivo (cabeçalho na linha 1)
+
+    def column(name, default=""):
+        if name not in df.columns:
+            return pd.Series([default] * n)
+        return df[name].astype(str).str.strip()
+
+    category = column("category").str.split(" - ", n=1).str[0].str.strip()
+    value_text = column("value").str.replace(",", ".", regex=False)
+    value = pd.to_numeric(value_text, errors="coerce")
+    direction = column("direction").str.capitalize().replace("", "Positiva")
+    action_type = column("action_type")
+    name = column("name")
+    name = name.where(name != "", "Carregamento " + (line - 1).astype(str))
+
+    load_type = category.map(lambda code: ACTION_CATEGORIES[code]["type"] if code in ACTION_CATEGORIES else None)
+    is_variable = load_type == "variavel"
+
+    checks = [
+        (~category.isin(list(ACTION_CATEGORIES)), lambda i: f"categoria desconhecida '{category[i]}'"),
+        (value.isna(), lambda i: f"valor inválido '{df['value'][i]}'"),
+        (value.notna() & ~np.isfinite(value), lambda i: f"valor não finito '{df['value'][i]}'"),
+        (np.isfinite(value) & (value < 0), lambda i: f"valor negativo {value[i]} (use direction = 'Negativa')"),
+        (~direction.isin(DIRECTIONS), lambda i: f"direção inválida '{direction[i]}' (use 'Positiva' ou 'Negativa')"),
+        (is_variable & ~action_type.isin(list(ACTION_FACTORS)),
+         lambda i: f"categoria de ação variável desconhecida ou ausente '{action_type[i]}'"),
+    ]
+    errors = []
+    for mask, message in checks:
+        for i in mask[mask].index:
+            errors.append((int(line[i]), f"Linha {line[i]}: {message(i)}"))
+    if errors:
+        raise LoadTableError([message for _, message in sorted(errors)])
+
+    neutral = {"ψ₀": 1.0, "ψ₁": 1.0, "ψ₂": 1.0}
+    action_type = action_type.where(is_variable, "")
+    return [
+        {
+            "name": row_name,
+            "type": row_type,
+            "category": row_category,
+            "value": float(row_value),
+            "factors": ACTION_FACTORS[row_action] if row_variable else neutral,
+            "action_type": row_action,
+            "direction": row_direction,
+        }
+        for row_name, row_type, row_category, row_value, row_action, row_variable, row_direction in zip(
+            name, load_type, category, value, action_type, is_variable, direction
+        )
+    ]
+
+
+# Função para ler e validar um arquivo de cargas; retorna a lista de cargas
+def read_loads(file, filename=None):
+    return validate_load_table(read_load_table(file, filename))
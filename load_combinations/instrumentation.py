@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from load_combinations.engine import family_offsets, group_loads
+
+# Medição de tempo por etapa da geração de combinações. Desligada, cada etapa custa só a
+# chamada de stage() e um gerenciador de contexto vazio; ligada, registra os tempos, as
+# contagens e emite uma linha de log estruturada (JSON) no logger "load_combinations.timing".
+#
+# Liga por padrão quando a variável de ambiente LOAD_COMBINATIONS_TIMING vale 1/true/yes.
+# A primeira linha emitida configura o logger (ver configure_timing_log), para que as
+# linhas apareçam mesmo sem configuração de logging na aplicação.
+
+TIMING_ENV = "LOAD_COMBINATIONS_TIMING"
+
+logger = logging.getLogger("load_combinations.timing")
+
+
+# Função para ler a configuração padrão da variável de ambiente
+def timing_enabled():
+    return os.environ.get(TIMING_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+# Função para garantir que as linhas de tempo sejam emitidas: o logger passa a INFO se o
+# nível ainda não foi definido e, se não houver handler nele nem nos ancestrais (logger
+# raiz), recebe um StreamHandler (stderr) só com a mensagem
+def configure_timing_log():
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+
+
+# Etapa desligada: não mede nada
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+# Etapa ligada: acumula o tempo decorrido no registro da medição
+class _Stage:
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+# Registro de tempos e contagens de uma geração
+class StageTimer:
+    def __init__(self, enabled=None, **context):
+        self.enabled = timing_enabled() if enabled is None else enabled
+        self.context = context
+        self.stages = {}
+        self.counts = {}
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counts[name] = value
+
+    def total(self):
+        return sum(self.stages.values())
+
+    def as_dict(self):
+        return {
+            **self.context,
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "total": round(self.total(), 6),
+            "counts": self.counts,
+        }
+
+    # Emite uma linha de log JSON com todas as etapas medidas
+    def log(self, event="combination_timings"):
+        if self.enabled:
+            configure_timing_log()
+            logger.info(json.dumps({"event": event, **self.as_dict()}, ensure_ascii=False))
+
+
+# Função para contar as combinações de cada família de estado limite, na ordem de
+# numeração. Usa os números das combinações, então vale também para conjuntos podados.
+def family_counts(combination_set, selected_types):
+    offsets = family_offsets(group_loads(combination_set.loads), selected_types)
+    numbers = np.asarray(combination_set.numbers)
+    bounds = [number for _, number in offsets] + [np.iinfo(np.int64).max]
+    counts = np.diff(np.searchsorted(numbers, bounds))
+    return [(family.label, int(count)) for (family, _), count in zip(offsets, counts)]
@@ -0,0 +1,73 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from load_combinations.engine import (
+    FAMILIES,
+    assemble_combination_set,
+    concat_combination_sets,
+    family_offsets,
+    group_loads,
+    make_combination,
+    structure_key,
+    structure_loads,
+)
+from load_combinations.factors import factor_table
+
+# Geração paralela: cada família de combinações selecionada (ELU Normal, Frequente, ...)
+# é enumerada em uma tarefa independente. O primeiro Nº de cada família vem dos tamanhos
+# das anteriores (family_offsets), então a junção na ordem das famílias reproduz
+# exatamente a numeração da geração serial.
+#
+# Na linha de comando, a opção --parallel de generate e serve usa este módulo.
+
+EXECUTORS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+# Tarefa executada no pool: enumera uma família a partir do seu primeiro número.
+# Recebe a chave estrutural (tuplas simples, baratas de serializar) em vez das cargas.
+def _build_family(key, family_index, first_number):
+    loads = structure_loads(key)
+    lookup = factor_table(loads).tolist()
+    groups = group_loads(loads)
+    family = FAMILIES[family_index]
+
+    def combinations():
+        number = first_number
+        for fixed, variables in family.slots(groups):
+            combination = make_combination(number, fixed, variables, lookup, family)
+            if combination is not None:
+                yield combination
+            number += 1
+
+    return assemble_combination_set(loads, combinations())
+
+
+# Função para montar a estrutura de combinações gerando as famílias em paralelo.
+#   executor     -> pool já existente (concurrent.futures.Executor), reaproveitado entre chamadas;
+#   kind         -> "process" ou "thread", usado quando `executor` não é informado;
+#   max_workers  -> tamanho do pool criado (padrão: número de CPUs).
+def build_structure_parallel(loads, selected_types, executor=None, kind="process", max_workers=None):
+    key = structure_key(loads)
+    selected_types = frozenset(selected_types)
+    groups = group_loads(loads)
+    tasks = [
+        (FAMILIES.index(family), number)
+        for family, number in family_offsets(groups, selected_types)
+        if family.size(groups)
+    ]
+
+    if executor is None:
+        if kind not in EXECUTORS:
+            raise ValueError(f"Tipo de executor desconhecido: '{kind}' (use {', '.join(EXECUTORS)})")
+        max_workers = max_workers or os.cpu_count() or 1
+        with EXECUTORS[kind](max_workers=min(max_workers, max(len(tasks), 1))) as pool:
+            parts = list(pool.map(_build_family, [key] * len(tasks), *zip(*tasks))) if tasks else []
+    else:
+        parts = list(executor.map(_build_family, [key] * len(tasks), *zip(*tasks))) if tasks else []
+
+    return concat_combination_sets(structure_loads(key), parts, key=(key, selected_types))
+
+
+# Equivalente paralelo de build_combination_set
+def build_combination_set_parallel(loads, selected_types, executor=None, kind="process", max_workers=None):
+    return build_structure_parallel(loads, selected_types, executor, kind, max_workers).with_loads(loads)
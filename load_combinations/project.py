@@ -0,0 +1,91 @@
+import json
+import math
+import os
+
+from load_combinations.tables import ACTION_CATEGORIES, ACTION_FACTORS, COMBINATION_TYPES
+
+DIRECTIONS = ["Positiva", "Negativa"]
+
+
+# Erro de validação de um arquivo de projeto ou de uma definição de carga
+class ProjectError(ValueError):
+    pass
+
+
+# Função para criar uma carga no mesmo formato produzido pela interface Streamlit.
+# Para ações variáveis, os fatores ψ vêm de ACTION_FACTORS[action_type].
+def make_load(name, category, value, direction="Positiva", action_type=""):
+    if category not in ACTION_CATEGORIES:
+        raise ProjectError(f"Categoria desconhecida: '{category}'")
+    if direction not in DIRECTIONS:
+        raise ProjectError(f"Direção inválida: '{direction}' (use 'Positiva' ou 'Negativa')")
+    value = float(value)
+    if not math.isfinite(value):
+        raise ProjectError(f"Valor inválido para '{name}': {value}")
+    if value < 0:
+        raise ProjectError(f"Valor negativo para '{name}': use direction='Negativa'")
+
+    factors = {"ψ₀": 1.0, "ψ₁": 1.0, "ψ₂": 1.0}
+    if ACTION_CATEGORIES[category]["type"] == "variavel":
+        if action_type not in ACTION_FACTORS:
+            raise ProjectError(f"Categoria de ação variável desconhecida para '{name}': '{action_type}'")
+        factors = ACTION_FACTORS[action_type]
+    else:
+        action_type = ""
+
+    return {
+        "name": name,
+        "type": ACTION_CATEGORIES[category]["type"],
+        "category": category,
+        "value": value,
+        "factors": factors,
+        "action_type": action_type,
+        "direction": direction,
+    }
+
+
+# Função para validar e normalizar um projeto já decodificado:
+#   {"loads": [{"name", "category", "value", "direction", "action_type"}, ...],
+#    "selected_types": [...]}   (opcional; padrão: todos os tipos)
+def parse_project(data):
+    if not isinstance(data, dict) or not isinstance(data.get("loads"), list):
+        raise ProjectError("O projeto deve ser um objeto com a lista 'loads'")
+
+    loads = []
+    for i, entry in enumerate(data["loads"]):
+        if not isinstance(entry, dict):
+            raise ProjectError(f"Carga {i + 1}: cada carga deve ser um objeto")
+        try:
+            loads.append(make_load(
+                entry.get("name", f"Carregamento {i + 1}"),
+                entry["category"],
+                entry.get("value", 0.0),
+                entry.get("direction", "Positiva"),
+                entry.get("action_type", ""),
+            ))
+        except KeyError as exc:
+            raise ProjectError(f"Carga {i + 1}: campo obrigatório ausente {exc}") from None
+        except (TypeError, ValueError) as exc:
+            raise ProjectError(f"Carga {i + 1}: {exc}") from None
+
+    selected_types = data.get("selected_types", COMBINATION_TYPES)
+    if not isinstance(selected_types, list) or not all(isinstance(t, str) for t in selected_types):
+        raise ProjectError("'selected_types' deve ser uma lista de nomes de tipos de combinação")
+    unknown = [t for t in selected_types if t not in COMBINATION_TYPES]
+    if unknown:
+        raise ProjectError(f"Tipos de combinação desconhecidos: {', '.join(unknown)}")
+    return loads, list(selected_types)
+
+
+# Função para ler um arquivo de projeto JSON ou uma tabela de cargas (.csv/.xlsx, com todos
+# os tipos de combinação); retorna (loads, selected_types)
+def load_project(path):
+    if os.path.splitext(str(path))[1].lower() in (".csv", ".xlsx"):
+        from load_combinations.importing import read_loads
+        return read_loads(path), list(COMBINATION_TYPES)
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ProjectError(f"{path}: JSON inválido ({exc})") from None
+    return parse_project(data)
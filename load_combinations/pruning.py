@@ -0,0 +1,94 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from load_combinations.engine import signed_values
+
+# Remoção de combinações redundantes, antes de enviá-las a um solver externo.
+#
+#   "duplicate" -> mesmo vetor de fatores de outra combinação do mesmo Tipo (ELU/ELS);
+#                  ex.: ELS Frequente Reversível e Irreversível, ou o ramo de vento da
+#                  ELU Rara, em que o vento usa ψ₀ sendo ou não a principal.
+#   "dominated" -> (opcional) outra combinação do mesmo Tipo e Critério tem todos os
+#                  fatores maiores ou iguais. Com todas as cargas não negativas, seu Q
+#                  nunca supera o da dominante, então ela nunca governa o máximo.
+#
+# Entre duplicatas permanece a de menor Nº; a numeração original é mantida.
+
+REASONS = {
+    "duplicate": "fatores idênticos aos da combinação mantida",
+    "dominated": "dominada: todos os fatores menores ou iguais aos da combinação mantida",
+}
+
+# Combinação removida, o motivo e o Nº da combinação mantida que a torna redundante
+class PrunedCombination(NamedTuple):
+    number: int
+    reason: str
+    kept_number: int
+
+
+# Função para encontrar linhas duplicadas dentro do mesmo Tipo; retorna {linha: linha mantida}
+def _duplicates(combination_set):
+    first_seen = {}
+    removed = {}
+    for row in range(len(combination_set)):
+        key = (combination_set.type_states[row], combination_set.coefficients[row].tobytes())
+        if key in first_seen:
+            removed[row] = first_seen[key]
+        else:
+            first_seen[key] = row
+    return removed
+
+
+# Função para encontrar linhas dominadas dentro de cada grupo (Tipo, Critério) entre as
+# linhas restantes; retorna {linha: linha dominante}.
+# As linhas são visitadas em ordem decrescente da soma dos fatores (uma dominante tem soma
+# maior) e comparadas apenas com as não dominadas já vistas: pela transitividade, quem é
+# dominado por uma linha removida também é dominado pela linha que a removeu.
+def _dominated(combination_set, rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault((combination_set.type_states[row], combination_set.criteria[row]), []).append(row)
+
+    removed = {}
+    for group_rows in groups.values():
+        matrix = combination_set.coefficients[group_rows]
+        order = np.argsort(-matrix.sum(axis=1), kind="stable")
+        maximal = np.empty_like(matrix)
+        maximal_rows = []
+        for k in order:
+            vector = matrix[k]
+            if maximal_rows:
+                covering = np.flatnonzero((maximal[:len(maximal_rows)] >= vector).all(axis=1))
+                if len(covering):
+                    removed[group_rows[k]] = maximal_rows[covering[0]]
+                    continue
+            maximal[len(maximal_rows)] = vector
+            maximal_rows.append(group_rows[k])
+    return removed
+
+
+# Função para remover combinações duplicadas e, opcionalmente, dominadas.
+# Retorna (conjunto reduzido, lista de PrunedCombination ordenada por Nº).
+def prune_combinations(combination_set, dominance=False):
+    removed = {row: ("duplicate", kept) for row, kept in _duplicates(combination_set).items()}
+
+    if dominance:
+        if (signed_values(combination_set.loads) < 0).any():
+            raise ValueError("A remoção por dominância só é válida com todas as cargas positivas (não negativas)")
+        remaining = [row for row in range(len(combination_set)) if row not in removed]
+        removed.update({row: ("dominated", kept) for row, kept in _dominated(combination_set, remaining).items()})
+
+    # Uma linha mantida como referência pode ter sido removida por dominância: seguir a
+    # cadeia até uma combinação que permaneceu no conjunto
+    def resolve(row):
+        while row in removed:
+            row = removed[row][1]
+        return row
+
+    kept_rows = [row for row in range(len(combination_set)) if row not in removed]
+    report = [
+        PrunedCombination(combination_set.numbers[row], reason, combination_set.numbers[resolve(kept)])
+        for row, (reason, kept) in sorted(removed.items())
+    ]
+    return combination_set.take(kept_rows), report
@@ -0,0 +1,110 @@
+import csv
+import os
+
+import numpy as np
+
+from load_combinations.engine import signed_values
+
+# Varredura paramétrica: muitos vetores de valores de carga (magnitude e sinal) avaliados
+# de uma vez sobre uma única estrutura de combinações.
+#
+# Arquivo de cenários (.csv): uma linha por cenário; a coluna "scenario" (opcional) dá o
+# nome e as demais colunas identificam a carga pelo nome ou pelo número (1, 2, ...).
+# Valores são com sinal (negativo = direção "Negativa"). Cargas sem coluna mantêm o valor
+# do projeto. O separador (vírgula, ponto e vírgula ou tabulação) é detectado; um arquivo
+# de coluna única, sem separador a detectar, é lido como CSV comum (vírgula).
+# Também é aceito um .npy (cenários × cargas) com os valores com sinal.
+
+SCENARIO_COLUMN = "scenario"
+
+
+# Função para converter um valor numérico do CSV, aceitando vírgula decimal
+def _parse_number(text):
+    text = text.strip()
+    if "," in text and "." not in text:
+        text = text.replace(",", ".")
+    return float(text)
+
+
+# Função para ler o arquivo de cenários; retorna (nomes, valores com sinal [cenários × cargas])
+def read_scenarios(path, loads):
+    if os.path.splitext(path)[1].lower() == ".npy":
+        values = np.load(path)
+        if values.ndim != 2 or values.shape[1] != len(loads):
+            raise ValueError(f"{path}: esperado array (cenários × {len(loads)} cargas), recebido {values.shape}")
+        return [str(i + 1) for i in range(values.shape[0])], np.asarray(values, dtype=np.float64)
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(f, dialect)
+        header = next(reader, None)
+        rows = [row for row in reader if any(cell.strip() for cell in row)]
+    if not header:
+        raise ValueError(f"{path}: arquivo de cenários vazio")
+
+    # Mapear colunas para índices de carga, pelo nome ou pelo número da carga
+    by_name = {load["name"]: i for i, load in enumerate(loads)}
+    name_column = None
+    load_columns = []
+    for column, title in enumerate(header):
+        title = title.strip()
+        if title.lower() == SCENARIO_COLUMN:
+            name_column = column
+        elif title in by_name:
+            load_columns.append((column, by_name[title]))
+        elif title.isdigit() and 1 <= int(title) <= len(loads):
+            load_columns.append((column, int(title) - 1))
+        else:
+            raise ValueError(f"{path}: coluna '{title}' não corresponde a nenhuma carga do projeto")
+
+    values = np.tile(signed_values(loads), (len(rows), 1))
+    names = []
+    for line, row in enumerate(rows, start=2):
+        names.append(row[name_column].strip() if name_column is not None else str(line - 1))
+        for column, load_idx in load_columns:
+            try:
+                values[line - 2, load_idx] = _parse_number(row[column])
+            except (IndexError, ValueError):
+                raise ValueError(f"{path}, linha {line}: valor inválido na coluna '{header[column]}'") from None
+    return names, values
+
+
+# Função para avaliar todos os cenários de uma vez, com a mesma soma na ordem dos termos e o
+# mesmo arredondamento da tabela (CombinationSet.q_values). Retorna Q [cenários × combinações] e, por cenário, o máximo e o mínimo de Q
+# com o Nº da combinação que governa.
+def evaluate_scenarios(combination_set, values):
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] != combination_set.coefficients.shape[1]:
+        raise ValueError(f"Esperado array (cenários × {combination_set.coefficients.shape[1]} cargas), recebido {values.shape}")
+    if not len(combination_set):
+        raise ValueError("Nenhuma combinação para avaliar")
+
+    q = combination_set.q_values(values)
+    numbers = np.asarray(combination_set.numbers, dtype=np.int64)
+    max_idx = q.argmax(axis=1)
+    min_idx = q.argmin(axis=1)
+    rows = np.arange(len(q))
+    return {
+        "q": q,
+        "max_q": q[rows, max_idx],
+        "max_combination": numbers[max_idx],
+        "min_q": q[rows, min_idx],
+        "min_combination": numbers[min_idx],
+    }
+
+
+# Função para gravar o resumo dos cenários (combinação governante por cenário) em CSV
+def write_governing_csv(path, names, evaluation):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([SCENARIO_COLUMN, "Q máx [kN/m²]", "Nº máx", "Q mín [kN/m²]", "Nº mín"])
+        for i, name in enumerate(names):
+            writer.writerow([
+                name, float(evaluation["max_q"][i]), int(evaluation["max_combination"][i]),
+                float(evaluation["min_q"][i]), int(evaluation["min_combination"][i])
+            ])
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import os
+
+from tornado.httpserver import HTTPServer
+from tornado.web import Application, RequestHandler
+
+from load_combinations.cache import ResultCache, input_hash
+from load_combinations.engine import COLUMNS, generate_combinations
+from load_combinations.parallel import EXECUTORS, build_combination_set_parallel
+from load_combinations.project import ProjectError, parse_project
+
+# Serviço HTTP/JSON local para gerar combinações sem a interface Streamlit (tornado, já
+# instalado como dependência do Streamlit).
+#
+#   POST /combinations  corpo: {"loads": [...], "selected_types": [...]} (formato de parse_project)
+#                       resposta: {"columns": COLUMNS, "count": n, "rows": [...]} (= generate_combinations)
+#   GET  /health        estado do pool, da fila e do cache
+#
+# A geração roda em um pool limitado de processos. No máximo `workers + queue_size`
+# requisições ficam em andamento; as excedentes recebem 503 com Retry-After na hora, em vez
+# de se acumularem na memória. Requisições iguais simultâneas compartilham a mesma geração,
+# e respostas recentes são servidas de um ResultCache sem passar pelo pool.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 1024 * 1024  # corpos maiores são recusados pelo próprio tornado
+JSON_MIME = "application/json; charset=utf-8"
+RETRY_AFTER_SECONDS = 1
+
+
+# Tarefa executada no pool: gera as linhas e já devolve a resposta codificada em JSON,
+# para que a serialização também fique fora do laço de eventos. Com `family_executor` as
+# famílias da requisição são enumeradas em paralelo nesse pool (o do serviço).
+def _generate_json(loads, selected_types, family_executor=None):
+    if family_executor is not None:
+        rows = build_combination_set_parallel(loads, selected_types, executor=family_executor).to_rows()
+    else:
+        rows = generate_combinations(loads, selected_types)
+    return json.dumps({"columns": COLUMNS, "count": len(rows), "rows": rows}, ensure_ascii=False).encode("utf-8")
+
+
+# Estado compartilhado pelos handlers: pool, limite de admissão, gerações em andamento e cache.
+#
+# Com `parallel` ("thread" ou "process"), o serviço mantém um único pool de famílias, criado
+# uma vez com `workers` posições, e as requisições enumeram suas famílias nele. Um pool não
+# pode ser repassado a processos, então as requisições rodam em threads (executor="thread",
+# o padrão nesse modo) e executor="process" é recusado.
+class CombinationService:
+    def __init__(self, workers=None, queue_size=None, executor=None, cache_entries=256, cache_mb=64, parallel=None):
+        if parallel and executor == "process":
+            raise ValueError("A geração paralela de famílias exige executor 'thread' (as requisições usam o pool de famílias do serviço)")
+        self.workers = workers or os.cpu_count() or 1
+        self.limit = self.workers + (self.workers * 2 if queue_size is None else queue_size)
+        self.executor = EXECUTORS[executor or ("thread" if parallel else "process")](max_workers=self.workers)
+        self.family_executor = EXECUTORS[parallel](max_workers=self.workers) if parallel else None
+        self.cache = ResultCache(max_entries=cache_entries, max_bytes=cache_mb * 1024 * 1024)
+        self.pending = {}
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    # Função para obter a resposta de um projeto; retorna None se o limite foi atingido
+    async def combinations_json(self, loads, selected_types):
+        key = input_hash(loads, selected_types)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+        if self.saturated():
+            return None
+
+        self.active += 1
+        future = asyncio.get_running_loop().run_in_executor(self.executor, _generate_json, loads, selected_types, self.family_executor)
+        self.pending[key] = future
+        try:
+            body = await asyncio.shield(future)
+        finally:
+            self.active -= 1
+            del self.pending[key]
+        self.completed += 1
+        self.cache.put(key, body, size=len(body))
+        return body
+
+    def saturated(self):
+        return self.active >= self.limit
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "limit": self.limit,
+            "active": self.active,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "cache": self.cache.stats(),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+        if self.family_executor is not None:
+            self.family_executor.shutdown(cancel_futures=True)
+
+
+class _JSONHandler(RequestHandler):
+    def initialize(self, service):
+        self.service = service
+
+    def write_json(self, status, data):
+        self.set_status(status)
+        self.set_header("Content-Type", JSON_MIME)
+        self.finish(json.dumps(data, ensure_ascii=False))
+
+
+class CombinationsHandler(_JSONHandler):
+    async def post(self):
+        # Com o limite atingido, recusa antes de decodificar o corpo: sob sobrecarga a
+        # recusa custa quase nada ao laço de eventos
+        if self.service.saturated():
+            return self.reject()
+        try:
+            loads, selected_types = parse_project(json.loads(self.request.body or b"null"))
+        except ProjectError as exc:
+            return self.write_json(400, {"error": str(exc)})
+        except ValueError as exc:
+            return self.write_json(400, {"error": f"JSON inválido ({exc})"})
+
+        body = await self.service.combinations_json(loads, selected_types)
+        if body is None:
+            return self.reject()
+        self.set_header("Content-Type", JSON_MIME)
+        self.finish(body)
+
+    def reject(self):
+        self.service.rejected += 1
+        self.set_header("Retry-After", str(RETRY_AFTER_SECONDS))
+        self.write_json(503, {"error": "Servidor ocupado; tente novamente"})
+
+
+class HealthHandler(_JSONHandler):
+    def get(self):
+        self.write_json(200, {"status": "ok", **self.service.stats()})
+
+
+# Função para montar a aplicação tornado sobre um CombinationService
+def make_app(service):
+    return Application([
+        (r"/combinations", CombinationsHandler, {"service": service}),
+        (r"/health", HealthHandler, {"service": service}),
+    ])
+
+
+# Função para rodar o serviço até ser interrompido; `ready` é chamado com o serviço já ouvindo
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None, **service_options):
+    service = CombinationService(**service_options)
+    server = HTTPServer(make_app(service), max_body_size=MAX_BODY_BYTES)
+    server.listen(port, address=host)
+    if ready:
+        ready(service)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        server.stop()
+        service.shutdown()
@@ -0,0 +1,63 @@
+# Dicionário com as categorias de ação conforme Tabela 1 da ABNT NBR 8800:2008
+ACTION_CATEGORIES = {
+    # Ações Permanentes
+    "G_Me": {"type": "permanente", "gamma": {"Normal": 1.25, "Especial": 1.15, "Excepcional": 1.10}, "is_wind": False},  # Peso próprio de estruturas metálicas
+    "G_Pr": {"type": "permanente", "gamma": {"Normal": 1.30, "Especial": 1.20, "Excepcional": 1.15}, "is_wind": False},  # Peso próprio de estruturas pré-fabricadas
+    "G_Si": {"type": "permanente", "gamma": {"Normal": 1.35, "Especial": 1.25, "Excepcional": 1.15}, "is_wind": False},  # Peso próprio de estruturas construídas in situ
+    "G_Ec": {"type": "permanente", "gamma": {"Normal": 1.40, "Especial": 1.30, "Excepcional": 1.20}, "is_wind": False},  # Elementos construtivos industrializados com adição in situ
+    "G_Eg": {"type": "permanente", "gamma": {"Normal": 1.50, "Especial": 1.40, "Excepcional": 1.30}, "is_wind": False},  # Elementos construtivos em geral e equipamentos
+    "SET": {"type": "permanente", "gamma": {"Normal": 1.35, "Especial": 1.25, "Excepcional": 1.15}, "is_wind": False},   # Assentamentos de apoios, retrações
+
+    # Ações Variáveis
+    "Q_U": {"type": "variavel", "gamma": {"Normal": 1.50, "Especial": 1.30, "Excepcional": 1.00}, "is_wind": False},    # Ações de valores máximos limitados
+    "Q_T": {"type": "variavel", "gamma": {"Normal": 1.20, "Especial": 1.10, "Excepcional": 1.00}, "is_wind": False},    # Temperatura (sem fogo)
+    "Q_V": {"type": "variavel", "gamma": {"Normal": 1.40, "Especial": 1.20, "Excepcional": 1.00}, "is_wind": True},     # Vento
+    "Q_G": {"type": "variavel", "gamma": {"Normal": 1.50, "Especial": 1.30, "Excepcional": 1.00}, "is_wind": False},    # Ações variáveis genéricas
+
+    # Ações Excepcionais
+    "Q_Exc": {"type": "excepcional", "gamma": {"Normal": 1.00, "Especial": 1.00, "Excepcional": 1.00}, "is_wind": False},  # Excepcional
+
+    # Nenhuma
+    "NONE": {"type": "permanente", "gamma": {"Normal": 1.00, "Especial": 1.00, "Excepcional": 1.00}, "is_wind": False},  # Nenhuma ação
+}
+
+# Opções de categoria exibidas na interface ("código - descrição"), na ordem da Tabela 1
+CATEGORY_OPTIONS = [
+    "G_Me - Peso próprio de estruturas metálicas",
+    "G_Pr - Peso próprio de estruturas pré-fabricadas",
+    "G_Si - Peso próprio de estruturas construídas in situ",
+    "G_Ec - Elementos construtivos industrializados com adição in situ",
+    "G_Eg - Elementos construtivos em geral e equipamentos",
+    "SET - Assentamentos de apoios, retrações",
+    "Q_U - Ações de valores máximos limitados",
+    "Q_T - Temperatura (sem fogo)",
+    "Q_V - Vento",
+    "Q_G - Ações variáveis genéricas",
+    "Q_Exc - Excepcional",
+    "NONE - Nenhuma ação",
+]
+
+# Dicionário com os fatores de combinação ψ₀, ψ₁, ψ₂ conforme Tabela 2 da ABNT NBR 8800
+ACTION_FACTORS = {
+    "Locais sem predominância de pesos/equipamentos fixos ou elevadas concentrações de pessoas": {"ψ₀": 0.5, "ψ₁": 0.4, "ψ₂": 0.3},
+    "Locais com predominância de pesos/equipamentos fixos ou elevadas concentrações de pessoas": {"ψ₀": 0.7, "ψ₁": 0.6, "ψ₂": 0.4},
+    "Bibliotecas, arquivos, depósitos, oficinas, garagens e coberturas": {"ψ₀": 0.8, "ψ₁": 0.7, "ψ₂": 0.6},
+    "Pressão dinâmica do vento nas estruturas em geral": {"ψ₀": 0.6, "ψ₁": 0.3, "ψ₂": 0.0},
+    "Variações uniformes de temperatura em relação à média anual local": {"ψ₀": 0.6, "ψ₁": 0.5, "ψ₂": 0.3},
+    "Passarelas de pedestres": {"ψ₀": 0.6, "ψ₁": 0.4, "ψ₂": 0.3},
+    "Vigas de rolamento de pontes rolantes": {"ψ₀": 1.0, "ψ₁": 0.8, "ψ₂": 0.5},
+    "Pilares e subestruturas que suportem vigas de rolamento de pontes rolantes": {"ψ₀": 0.7, "ψ₁": 0.6, "ψ₂": 0.4}
+}
+
+# Tipos de combinação selecionáveis, na ordem exibida na interface
+COMBINATION_TYPES = [
+    "ELU Normal",
+    "ELU Frequente",
+    "ELU Rara",
+    "ELU Acidental",
+    "ELS Normal",
+    "ELS Quase Permanente",
+    "ELS Frequente - Danos Reversíveis",
+    "ELS Frequente - Danos Irreversíveis",
+    "ELS Rara",
+]